@@ -1,7 +1,6 @@
 """Main entry point for the logistics agents application."""
 
 import click
-from src.logistics_agents.main import main
 
 
 @click.command()
@@ -19,6 +18,8 @@ def cli(debug: bool, data_path: str) -> None:
         import os
         os.environ["DATA_PATH"] = data_path
     
+    # Imported here so --help doesn't load every agent and the SDK
+    from src.logistics_agents.main import main
     main()
 
 
@@ -10,17 +10,32 @@ This package contains all the specialized agents for supply chain optimization:
 Each agent has specialized MCP tools and follows the single responsibility principle.
 """
 
-# Import all agents for easy access
-from .agent_01_threshold_monitor.agent import InventoryThresholdMonitor
-from .agent_02_route_computer.agent import RouteComputer
-from .agent_03_restock_calculator.agent import RestockingCalculator
-from .agent_04_order_consolidator.agent import OrderConsolidator
-from .agent_05_orchestrator.agent import InventoryOrchestrator
-
-__all__ = [
-    "InventoryThresholdMonitor",
-    "RouteComputer",
-    "RestockingCalculator",
-    "OrderConsolidator",
-    "InventoryOrchestrator",
-]
+from importlib import import_module
+from typing import Any
+
+# Agents are imported on first access so that using one agent does not
+# pull in the other four (and their tool/SDK dependencies)
+_AGENT_MODULES = {
+    "InventoryThresholdMonitor": ".agent_01_threshold_monitor.agent",
+    "RouteComputer": ".agent_02_route_computer.agent",
+    "RestockingCalculator": ".agent_03_restock_calculator.agent",
+    "OrderConsolidator": ".agent_04_order_consolidator.agent",
+    "InventoryOrchestrator": ".agent_05_orchestrator.agent",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an agent class the first time it is accessed."""
+    module_path = _AGENT_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily imported agents in dir()."""
+    return sorted(list(globals()) + __all__)
@@ -4,13 +4,102 @@ Team Member: Martin
 Focus: Learning @function_tool creation and basic data analysis patterns.
 """
 
-from agents import Agent
+import asyncio
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
+import numpy as np
+from agents import Agent, RunContextWrapper
 from ...config.settings import settings
 from ...models.inventory_data import InventoryContext
 from ...utils.agent_runner import log_agent_execution
 # Import simplified tools
-from .tools.threshold_checker import check_inventory_thresholds
-from .tools.priority_classifier import classify_item_priority
+from .tools.threshold_checker import (
+    _check_inventory_thresholds, check_inventory_thresholds)
+from .tools.priority_classifier import (
+    _classify_item_priority, classify_item_priority)
+from .tools._kernels import severity_index, stockout_days
+
+# Severity labels indexed by the number of thresholds the stock has cleared
+_SEVERITY_LEVELS = ("CRITICAL", "HIGH", "MEDIUM", "LOW")
+_SEVERITY_LEVELS_ARR = np.array(_SEVERITY_LEVELS)
+
+# Business impact scoring tables: base score by category, adjustments by
+# customer priority and revenue tier (>500, >1000)
+_CATEGORY_SCORES = {
+    'haircare': 70,
+    'skincare': 85,
+    'cosmetics': 75,
+    'accessories': 50
+}
+_DEFAULT_CATEGORY_SCORE = 60
+_PRIORITY_ADJUSTMENTS = {'PREMIUM': 20, 'STANDARD': 10}
+_REVENUE_ADJUSTMENTS = (0, 10, 15)
+
+# Unknown categories/priorities map to the last row of the lookup table
+_CATEGORY_INDEX = {category: i for i, category in enumerate(_CATEGORY_SCORES)}
+_PRIORITY_INDEX = {priority: i for i, priority in enumerate(_PRIORITY_ADJUSTMENTS)}
+_OTHER_CATEGORY = len(_CATEGORY_INDEX)
+_OTHER_PRIORITY = len(_PRIORITY_INDEX)
+
+# Precomputed score for every (category, priority, revenue tier) combination
+_IMPACT_LUT = tuple(
+    tuple(
+        tuple(min(100, base + priority_adj + revenue_adj)
+              for revenue_adj in _REVENUE_ADJUSTMENTS)
+        for priority_adj in (*_PRIORITY_ADJUSTMENTS.values(), 0)
+    )
+    for base in (*_CATEGORY_SCORES.values(), _DEFAULT_CATEGORY_SCORE)
+)
+_IMPACT_LUT_ARR = np.array(_IMPACT_LUT, dtype=np.int16)
+
+
+def _category_index(item_category: str) -> int:
+    """
+    Map a category name or ProductCategory to its impact table row.
+
+    Lowercase names and ProductCategory members (a str enum) hit the table
+    directly, so only unexpected spellings pay for a .lower() call.
+    """
+    category_idx = _CATEGORY_INDEX.get(item_category)
+    if category_idx is None:
+        category_idx = _CATEGORY_INDEX.get(item_category.lower(), _OTHER_CATEGORY)
+    return category_idx
+
+
+# Default threshold monitoring parameters (read-only, shared by all instances)
+_THRESHOLD_PARAMETERS: Mapping[str, float] = MappingProxyType({
+    "critical_threshold_percentage": 0.1,    # 10% of reorder point
+    "warning_threshold_percentage": 0.25,    # 25% of reorder point
+    "urgent_days_threshold": 7,              # Less than 7 days stock
+    "critical_days_threshold": 3,            # Less than 3 days stock
+    "high_demand_variability_threshold": 0.3,  # CV > 30%
+    "lead_time_buffer_percentage": 0.2       # 20% lead time buffer
+})
+
+# Agent instructions, built once at import and shared by every instance
+_INSTRUCTIONS = """You are an Inventory Threshold Monitor agent in a multi-agent logistics system.
+
+**Learning Focus**: Demonstrate @function_tool usage and basic data analysis patterns.
+
+**Your Role**: Monitor inventory levels and identify items below reorder thresholds.
+
+**Available Tools**:
+- check_inventory_thresholds: Check which items are below their reorder points
+- classify_item_priority: Classify urgent items by priority (HIGH/MEDIUM/LOW)
+
+**Agent Pattern**: You work as part of an "Agents as Tools" system where:
+1. You analyze inventory data to find threshold violations
+2. You classify the urgency of items needing restocking
+3. Your analysis helps other agents (route planning, quantity calculation) make decisions
+
+**Approach**:
+1. Use check_inventory_thresholds to identify items below reorder points
+2. Use classify_item_priority to prioritize which items need immediate attention
+3. Focus on clear, actionable threshold analysis that other agents can use
+
+Keep responses focused on threshold violations and priority classifications that help coordinate the supply chain workflow."""
 
 
 @log_agent_execution
@@ -32,29 +121,33 @@ class InventoryThresholdMonitor:
 
     def _get_instructions(self) -> str:
         """Get instructions for the threshold monitoring agent."""
-        return """You are an Inventory Threshold Monitor agent in a multi-agent logistics system.
-
-**Learning Focus**: Demonstrate @function_tool usage and basic data analysis patterns.
+        return _INSTRUCTIONS
 
-**Your Role**: Monitor inventory levels and identify items below reorder thresholds.
+    async def analyze(self, context: InventoryContext) -> str:
+        """
+        Run both threshold tools directly, without an LLM round-trip.
 
-**Available Tools**:
-- check_inventory_thresholds: Check which items are below their reorder points
-- classify_item_priority: Classify urgent items by priority (HIGH/MEDIUM/LOW)
+        The two tools are independent reads of the same context, so they
+        run concurrently in worker threads. Use the LLM agent instead when
+        the analysis needs reasoning over the tool output.
 
-**Agent Pattern**: You work as part of an "Agents as Tools" system where:
-1. You analyze inventory data to find threshold violations
-2. You classify the urgency of items needing restocking
-3. Your analysis helps other agents (route planning, quantity calculation) make decisions
+        Args:
+            context: Inventory context to analyze
 
-**Approach**:
-1. Use check_inventory_thresholds to identify items below reorder points
-2. Use classify_item_priority to prioritize which items need immediate attention
-3. Focus on clear, actionable threshold analysis that other agents can use
+        Returns:
+            Threshold check followed by the priority classification
+        """
+        wrapper = RunContextWrapper(context=context)
+        # Build the shared arrays up front so the threads only read them
+        context.below_threshold_mask
 
-Keep responses focused on threshold violations and priority classifications that help coordinate the supply chain workflow."""
+        thresholds, priorities = await asyncio.gather(
+            asyncio.to_thread(_check_inventory_thresholds, wrapper),
+            asyncio.to_thread(_classify_item_priority, wrapper),
+        )
+        return f"{thresholds}\n\n{priorities}"
 
-    def get_threshold_parameters(self) -> dict:
+    def get_threshold_parameters(self) -> Mapping[str, float]:
         """
         Get default threshold monitoring parameters.
 
@@ -62,16 +155,9 @@ Keep responses focused on threshold violations and priority classifications that
         of inventory patterns and business requirements.
 
         Returns:
-            Dictionary containing threshold monitoring parameters
+            Read-only mapping containing threshold monitoring parameters
         """
-        return {
-            "critical_threshold_percentage": 0.1,    # 10% of reorder point
-            "warning_threshold_percentage": 0.25,    # 25% of reorder point
-            "urgent_days_threshold": 7,              # Less than 7 days stock
-            "critical_days_threshold": 3,            # Less than 3 days stock
-            "high_demand_variability_threshold": 0.3,  # CV > 30%
-            "lead_time_buffer_percentage": 0.2       # 20% lead time buffer
-        }
+        return _THRESHOLD_PARAMETERS
 
     def calculate_threshold_severity(self, current_stock: int,
                                      reorder_point: int,
@@ -94,14 +180,32 @@ Keep responses focused on threshold violations and priority classifications that
         Returns:
             Severity level: 'CRITICAL', 'HIGH', 'MEDIUM', 'LOW'
         """
-        if current_stock <= safety_stock * 0.5:
-            return 'CRITICAL'
-        elif current_stock <= safety_stock:
-            return 'HIGH'
-        elif current_stock <= reorder_point * 0.8:
-            return 'MEDIUM'
-        else:
-            return 'LOW'
+        # Branchless: each check only counts once the stricter ones passed
+        above_half_safety = current_stock > safety_stock * 0.5
+        above_safety = current_stock > safety_stock
+        above_reorder = current_stock > reorder_point * 0.8
+        return _SEVERITY_LEVELS[
+            above_half_safety * (1 + above_safety * (1 + above_reorder))
+        ]
+
+    def calculate_threshold_severity_vec(self, current_stock: np.ndarray,
+                                         reorder_point: np.ndarray,
+                                         safety_stock: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_threshold_severity over whole inventory arrays.
+
+        Args:
+            current_stock: Current stock level per item
+            reorder_point: Reorder threshold level per item
+            safety_stock: Safety stock level per item
+
+        Returns:
+            Array of severity levels: 'CRITICAL', 'HIGH', 'MEDIUM', 'LOW'
+        """
+        return _SEVERITY_LEVELS_ARR[
+            severity_index(np.asarray(current_stock), np.asarray(safety_stock),
+                           np.asarray(reorder_point))
+        ]
 
     def estimate_days_to_stockout(self, current_stock: int,
                                   daily_demand: float,
@@ -136,6 +240,26 @@ Keep responses focused on threshold violations and priority classifications that
 
         return max(0, int(adjusted_days))
 
+    def estimate_days_to_stockout_vec(self, current_stock: np.ndarray,
+                                      daily_demand: np.ndarray,
+                                      demand_variability: np.ndarray) -> np.ndarray:
+        """
+        Vectorized estimate_days_to_stockout over whole inventory arrays.
+
+        Prefer this over calling the scalar version in a loop.
+
+        Args:
+            current_stock: Current stock level per item
+            daily_demand: Average daily demand rate per item
+            demand_variability: Demand variability coefficient per item
+
+        Returns:
+            Array of estimated days until stockout
+        """
+        return stockout_days(np.asarray(current_stock, dtype=np.float64),
+                             np.asarray(daily_demand, dtype=np.float64),
+                             np.asarray(demand_variability, dtype=np.float64))
+
     def get_business_impact_score(self, item_category: str,
                                   customer_priority: str,
                                   revenue_impact: float) -> int:
@@ -150,36 +274,43 @@ Keep responses focused on threshold violations and priority classifications that
         - Brand impact and customer satisfaction implications
 
         Args:
-            item_category: Product category 
+            item_category: Product category (name or ProductCategory)
             customer_priority: Customer priority level
             revenue_impact: Revenue impact of stockout
 
         Returns:
             Business impact score (0-100)
         """
-        # Base score by category
-        category_scores = {
-            'haircare': 70,
-            'skincare': 85,
-            'cosmetics': 75,
-            'accessories': 50
-        }
+        category_idx = _category_index(item_category)
+        priority_idx = _PRIORITY_INDEX.get(customer_priority, _OTHER_PRIORITY)
+        revenue_tier = int(revenue_impact > 500) + int(revenue_impact > 1000)
+
+        return _IMPACT_LUT[category_idx][priority_idx][revenue_tier]
 
-        base_score = category_scores.get(item_category.lower(), 60)
+    def get_business_impact_score_vec(self, item_categories: Sequence[str],
+                                      customer_priorities: Sequence[str],
+                                      revenue_impacts: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_business_impact_score over whole inventory columns.
 
-        # Adjust for customer priority
-        if customer_priority == 'PREMIUM':
-            base_score += 20
-        elif customer_priority == 'STANDARD':
-            base_score += 10
+        Args:
+            item_categories: Product category per item
+            customer_priorities: Customer priority level per item
+            revenue_impacts: Revenue impact of stockout per item
 
-        # Adjust for revenue impact
-        if revenue_impact > 1000:
-            base_score += 15
-        elif revenue_impact > 500:
-            base_score += 10
+        Returns:
+            Array of business impact scores (0-100)
+        """
+        category_idx = np.fromiter(
+            (_category_index(category) for category in item_categories),
+            dtype=np.intp)
+        priority_idx = np.fromiter(
+            (_PRIORITY_INDEX.get(priority, _OTHER_PRIORITY)
+             for priority in customer_priorities), dtype=np.intp)
+        revenue_impacts = np.asarray(revenue_impacts)
+        revenue_tier = (revenue_impacts > 500).astype(np.intp) + (revenue_impacts > 1000)
 
-        return min(100, base_score)
+        return _IMPACT_LUT_ARR[category_idx, priority_idx, revenue_tier]
 
 
 # TODO for Martin: Implementation checklist
@@ -250,3 +381,17 @@ KEY METRICS TO TRACK:
 - False positive rate and system reliability
 - Response time from alert to action
 """
+
+
+@lru_cache(maxsize=1)
+def get_threshold_monitor() -> InventoryThresholdMonitor:
+    """
+    Get the shared threshold monitor instance.
+
+    The agent only holds constant instructions and tools, so one instance
+    can be reused instead of rebuilding the Agent on every construction.
+
+    Returns:
+        InventoryThresholdMonitor: Process-wide threshold monitor agent
+    """
+    return InventoryThresholdMonitor()
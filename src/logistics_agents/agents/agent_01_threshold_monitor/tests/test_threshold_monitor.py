@@ -52,6 +52,64 @@ class TestInventoryThresholdMonitor:
         assert result is not None
         assert result.final_output is not None
 
+    @pytest.mark.asyncio
+    async def test_analyze_runs_both_tools(self, agent, sample_inventory_context):
+        """Test the direct analysis path without calling the LLM."""
+        result = await agent.analyze(sample_inventory_context)
+
+        assert "items below threshold" in result or "above their reorder" in result
+        assert "PRIORITY CLASSIFICATION" in result
+
+    def test_severity_vec_matches_scalar(self, agent):
+        """Test that vectorized severity agrees with the scalar version."""
+        import numpy as np
+
+        cases = [(stock, reorder, safety)
+                 for stock in range(0, 40, 3)
+                 for reorder in (0, 5, 20, 33)
+                 for safety in (0, 4, 10, 15)]
+        stock, reorder, safety = (np.array(col) for col in zip(*cases))
+
+        expected = [agent.calculate_threshold_severity(*case) for case in cases]
+        assert list(agent.calculate_threshold_severity_vec(
+            stock, reorder, safety)) == expected
+
+    def test_days_to_stockout_vec_matches_scalar(self, agent):
+        """Test that vectorized stockout estimates agree with the scalar version."""
+        import numpy as np
+
+        cases = [(stock, demand, variability)
+                 for stock in (0, 1, 10, 57, 100)
+                 for demand in (-1.0, 0.0, 0.3, 2.5, 10.0)
+                 for variability in (0.0, 0.3, 1.2)]
+        stock, demand, variability = (np.array(col) for col in zip(*cases))
+
+        expected = [agent.estimate_days_to_stockout(*case) for case in cases]
+        assert list(agent.estimate_days_to_stockout_vec(
+            stock, demand, variability)) == expected
+
+    def test_business_impact_vec_matches_scalar(self, agent):
+        """Test that the impact lookup table matches the scalar scoring."""
+        cases = [(category, priority, revenue)
+                 for category in ("haircare", "Skincare", "accessories", "toys")
+                 for priority in ("PREMIUM", "STANDARD", "BASIC")
+                 for revenue in (0, 500, 500.01, 1000, 5000)]
+        categories, priorities, revenues = zip(*cases)
+
+        expected = [agent.get_business_impact_score(*case) for case in cases]
+        assert list(agent.get_business_impact_score_vec(
+            categories, priorities, revenues)) == expected
+        assert agent.get_business_impact_score("skincare", "PREMIUM", 5000) == 100
+        assert agent.get_business_impact_score("toys", "STANDARD", 600) == 80
+
+    def test_business_impact_accepts_category_enum(self, agent):
+        """Test that ProductCategory members score like their names."""
+        from ....models.inventory_data import ProductCategory
+
+        for category in ProductCategory:
+            assert agent.get_business_impact_score(category, "PREMIUM", 600) == \
+                agent.get_business_impact_score(category.value, "PREMIUM", 600)
+
     @pytest.mark.skip(reason="Model validation doesn't allow empty items list")
     @pytest.mark.asyncio
     async def test_agent_empty_context(self, agent):
@@ -83,6 +141,76 @@ class TestThresholdMonitorTools:
         assert hasattr(classify_item_priority, 'name')
         assert hasattr(classify_item_priority, 'description')
 
+    def test_context_arrays_track_items(self, sample_inventory_context_copy):
+        """Test that the cached stock/threshold arrays follow the items."""
+        context = sample_inventory_context_copy
+
+        assert list(context.stock_arr) == [
+            item.current_stock for item in context.items]
+        assert list(context.threshold_arr) == [
+            item.reorder_threshold for item in context.items]
+        assert list(context.below_threshold_mask) == [
+            item.is_below_threshold for item in context.items]
+        assert context.items_below_threshold == [
+            item for item in context.items if item.is_below_threshold]
+        assert context.critical_items == [
+            item for item in context.items if item.is_critical]
+
+        # In-place edits are picked up once the context is told about them
+        context.items[0].current_stock = context.items[0].reorder_threshold + 1
+        context.mark_items_changed()
+        assert context.stock_arr[0] == context.items[0].current_stock
+        assert context.items[0] not in context.items_below_threshold
+
+        # Counts beyond the int32 range still fit the columns
+        context.items[0].current_stock = 3_000_000_000
+        context.mark_items_changed()
+        assert context.stock_arr[0] == 3_000_000_000
+        assert context.reorder_qty_arr[0] == context.items[0].order_quantity - 3_000_000_000
+
+    def test_priority_masks(self):
+        """Test priority bucketing by remaining share of the threshold."""
+        import numpy as np
+        from ..tools._kernels import priority_masks
+
+        stock = np.array([1, 5, 9, 20])
+        thresh = np.array([10, 10, 10, 10])
+        high, medium, low = priority_masks(stock, thresh)
+
+        assert list(np.flatnonzero(high)) == [0]
+        assert list(np.flatnonzero(medium)) == [1]
+        assert list(np.flatnonzero(low)) == [2]  # Item 3 is above its threshold
+
+        # A precomputed below-threshold mask is honoured
+        high, medium, low = priority_masks(
+            stock, thresh, below=np.array([False, True, True, False]))
+        assert not high.any()
+        assert list(np.flatnonzero(medium | low)) == [1, 2]
+
+    def test_first_k_stops_after_k_hits(self):
+        """Test first-k index collection across scan blocks."""
+        import numpy as np
+        from ..tools._kernels import first_k
+
+        mask = np.zeros(20, dtype=bool)
+        mask[[2, 3, 9, 15, 16, 19]] = True
+
+        assert list(first_k(mask, 4, block=4)) == [2, 3, 9, 15]
+        assert list(first_k(mask, 10, block=4)) == [2, 3, 9, 15, 16, 19]
+        assert list(first_k(np.zeros(3, dtype=bool), 5)) == []
+
+    def test_most_urgent_orders_by_remaining_share(self):
+        """Test top-K selection by stock/threshold ratio with stable ties."""
+        import numpy as np
+        from ..tools._kernels import most_urgent
+
+        stock = np.array([2, 0, 1, 0, 5, 1])
+        thresh = np.array([10, 10, 10, 10, 10, 10])
+        mask = np.array([True, True, True, True, False, True])
+
+        assert list(most_urgent(stock, thresh, mask, 3)) == [1, 3, 2]
+        assert list(most_urgent(stock, thresh, mask, 10)) == [1, 3, 2, 5, 0]
+
 
 @pytest.mark.agent01
 @pytest.mark.integration
@@ -0,0 +1,140 @@
+"""Vectorized kernels shared by the threshold monitor tools.
+
+Single Responsibility: Array math over the InventoryContext item columns.
+Team Member: Martin
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def priority_masks(
+    stock: np.ndarray, thresh: np.ndarray, below: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Flag below-threshold items as HIGH/MEDIUM/LOW priority.
+
+    Items are bucketed by how much of their reorder threshold is left:
+    under 30% is HIGH, under 60% is MEDIUM, anything else below the
+    threshold is LOW. Items above their threshold are in no bucket.
+
+    Args:
+        stock: Current stock level per item
+        thresh: Reorder threshold per item
+        below: Optional precomputed ``stock <= thresh`` mask
+
+    Returns:
+        Tuple of (high, medium, low) boolean masks over the input arrays
+    """
+    if below is None:
+        below = stock <= thresh
+    ratio = stock / np.maximum(thresh, 1)
+
+    high = below & (ratio < 0.3)
+    medium = below & (ratio >= 0.3) & (ratio < 0.6)
+    low = below & (ratio >= 0.6)
+
+    return high, medium, low
+
+
+def first_k(mask: np.ndarray, k: int, block: int = 4096) -> np.ndarray:
+    """
+    Return the indices of the first ``k`` set entries of ``mask``.
+
+    Scans the mask a block at a time and stops once ``k`` hits are found,
+    so memory stays bounded by the block size rather than the number of
+    set entries.
+
+    Args:
+        mask: Boolean mask to scan
+        k: Maximum number of indices to return
+        block: Number of entries scanned per step
+
+    Returns:
+        Index array of up to ``k`` set positions, in order
+    """
+    found = []
+    remaining = k
+    for start in range(0, len(mask), block):
+        hits = np.flatnonzero(mask[start:start + block])[:remaining]
+        if len(hits):
+            found.append(hits + start)
+            remaining -= len(hits)
+            if not remaining:
+                break
+    return np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+
+
+def most_urgent(
+    stock: np.ndarray, thresh: np.ndarray, mask: np.ndarray, k: int
+) -> np.ndarray:
+    """
+    Pick the ``k`` masked items with the least of their threshold left.
+
+    Uses a partial partition instead of sorting every candidate; ties keep
+    their original item order so the selection is deterministic.
+
+    Args:
+        stock: Current stock level per item
+        thresh: Reorder threshold per item
+        mask: Items eligible for selection
+        k: Maximum number of items to return
+
+    Returns:
+        Index array of up to ``k`` items, most urgent first
+    """
+    candidates = np.flatnonzero(mask)
+    ratio = stock[candidates] / np.maximum(thresh[candidates], 1)
+    if len(candidates) <= k:
+        return candidates[np.argsort(ratio, kind="stable")]
+
+    # Everything at or below the k-th smallest ratio, still in item order
+    cutoff = np.partition(ratio, k - 1)[k - 1]
+    shortlist = np.flatnonzero(ratio <= cutoff)
+    order = np.argsort(ratio[shortlist], kind="stable")[:k]
+    return candidates[shortlist[order]]
+
+
+def severity_index(
+    stock: np.ndarray, safety: np.ndarray, reorder: np.ndarray
+) -> np.ndarray:
+    """
+    Compute severity bucket indices without per-item branching.
+
+    Each comparison only counts once all the stricter ones have passed, so
+    the result matches an if/elif ladder even when thresholds are unordered.
+
+    Args:
+        stock: Current stock level per item
+        safety: Safety stock level per item
+        reorder: Reorder threshold level per item
+
+    Returns:
+        Int array of indices: 0=CRITICAL, 1=HIGH, 2=MEDIUM, 3=LOW
+    """
+    above_half_safety = (stock > safety * 0.5).astype(np.int8)
+    above_safety = (stock > safety).astype(np.int8)
+    above_reorder = (stock > reorder * 0.8).astype(np.int8)
+    return above_half_safety * (1 + above_safety * (1 + above_reorder))
+
+
+def stockout_days(
+    stock: np.ndarray, demand: np.ndarray, variability: np.ndarray
+) -> np.ndarray:
+    """
+    Estimate days until stockout for every item in one pass.
+
+    Args:
+        stock: Current stock level per item
+        demand: Average daily demand per item
+        variability: Demand variability coefficient per item
+
+    Returns:
+        Int array of days until stockout (999 where there is no demand)
+    """
+    has_demand = demand > 0
+    # Divide by 1 where there is no demand; those rows are replaced below
+    base_days = stock / np.where(has_demand, demand, 1.0)
+    adjusted_days = base_days / (1.0 + variability)
+    return np.where(has_demand, np.maximum(0, adjusted_days).astype(np.int64), 999)
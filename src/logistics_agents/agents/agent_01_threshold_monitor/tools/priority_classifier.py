@@ -4,14 +4,20 @@ Single Responsibility: Item priority classification based on urgency.
 Team Member: Martin
 """
 
+from operator import attrgetter
+
+import numpy as np
 from agents import function_tool, RunContextWrapper
 from ....models.inventory_data import InventoryContext
 from ....utils.logging_config import log_tool_interaction
+from ._kernels import most_urgent, priority_masks
+
+# Fields shown for each high priority example, fetched in one C-level call
+_example_fields = attrgetter("item_id", "current_stock", "category")
 
 
-@function_tool
 @log_tool_interaction("PriorityClassifier")
-def classify_item_priority(wrapper: RunContextWrapper[InventoryContext]) -> str:
+def _classify_item_priority(wrapper: RunContextWrapper[InventoryContext]) -> str:
     """
     Classify items by priority level based on urgency and business factors.
 
@@ -19,37 +25,39 @@ def classify_item_priority(wrapper: RunContextWrapper[InventoryContext]) -> str:
     complex business logic.
     """
     context = wrapper.context
+    items = context.items
+    stock, thresh = context.stock_arr, context.threshold_arr
 
-    # Group items by priority levels
-    high_priority = []
-    medium_priority = []
-    low_priority = []
-
-    for item in context.items:
-        if item.is_below_threshold:
-            # Simple priority logic based on stock levels
-            stock_ratio = item.current_stock / max(item.reorder_threshold, 1)
-
-            if stock_ratio < 0.3:  # Very low stock
-                high_priority.append(item)
-            elif stock_ratio < 0.6:  # Moderately low stock
-                medium_priority.append(item)
-            else:  # Just below threshold
-                low_priority.append(item)
+    # Flag all items by priority level in one vectorized pass; only the
+    # counts and the few displayed HIGH items are needed afterwards
+    high_mask, medium_mask, low_mask = priority_masks(
+        stock, thresh, context.below_threshold_mask)
+    high_count = int(np.count_nonzero(high_mask))
 
     # Build priority summary
-    summary = f"🎯 PRIORITY CLASSIFICATION:\n"
-    summary += f"🔴 HIGH Priority: {len(high_priority)} items (urgent restocking)\n"
-    summary += f"🟡 MEDIUM Priority: {len(medium_priority)} items (plan restocking)\n"
-    summary += f"🟢 LOW Priority: {len(low_priority)} items (monitor closely)\n\n"
-
-    # Show examples of high priority items
-    if high_priority:
-        summary += "🔴 High Priority Items:\n"
-        for item in high_priority[:3]:  # Show first 3
-            summary += f"• {item.item_id}: {item.current_stock} units ({item.category})\n"
-        if len(high_priority) > 3:
-            summary += f"... and {len(high_priority) - 3} more high priority items\n"
-
-    summary += "\n💡 Recommendation: Focus immediate attention on HIGH priority items"
-    return summary
+    parts = [
+        "🎯 PRIORITY CLASSIFICATION:",
+        f"🔴 HIGH Priority: {high_count} items (urgent restocking)",
+        f"🟡 MEDIUM Priority: {np.count_nonzero(medium_mask)} items (plan restocking)",
+        f"🟢 LOW Priority: {np.count_nonzero(low_mask)} items (monitor closely)",
+        "",
+    ]
+
+    # Show the most urgent high priority items
+    if high_count:
+        parts.append("🔴 High Priority Items:")
+        for i in most_urgent(stock, thresh, high_mask, 3):  # Show top 3
+            item_id, current_stock, category = _example_fields(items[i])
+            parts.append(f"• {item_id}: {current_stock} units ({category})")
+        if high_count > 3:
+            parts.append(
+                f"... and {high_count - 3} more high priority items")
+
+    parts.append("")
+    parts.append("💡 Recommendation: Focus immediate attention on HIGH priority items")
+    return "\n".join(parts)
+
+
+classify_item_priority = function_tool(
+    _classify_item_priority, name_override="classify_item_priority"
+)
@@ -4,14 +4,20 @@ Single Responsibility: Basic threshold violation detection.
 Team Member: Martin
 """
 
+from operator import attrgetter
+
+import numpy as np
 from agents import function_tool, RunContextWrapper
 from ....models.inventory_data import InventoryContext
 from ....utils.logging_config import log_tool_interaction
+from ._kernels import first_k
+
+# Fields shown for each example violation, fetched in one C-level call
+_example_fields = attrgetter("item_id", "current_stock", "reorder_threshold", "category")
 
 
-@function_tool
 @log_tool_interaction("ThresholdChecker")
-def check_inventory_thresholds(wrapper: RunContextWrapper[InventoryContext]) -> str:
+def _check_inventory_thresholds(wrapper: RunContextWrapper[InventoryContext]) -> str:
     """
     Check which inventory items are below their reorder thresholds.
 
@@ -19,31 +25,34 @@ def check_inventory_thresholds(wrapper: RunContextWrapper[InventoryContext]) ->
     complex business logic.
     """
     context = wrapper.context
+    items = context.items
+    total_items = len(items)
+
+    # Mask is computed once per context and shared with the other tools
+    below_mask = context.below_threshold_mask
+    below_count = int(np.count_nonzero(below_mask))
 
-    items_below = []
-    total_items = len(context.items)
+    if not below_count:
+        return f"✅ All {total_items} items are above their reorder thresholds"
 
-    for item in context.items:
-        if item.is_below_threshold:
-            items_below.append({
-                "item_id": item.item_id,
-                "current_stock": item.current_stock,
-                "threshold": item.reorder_threshold,
-                "category": item.category
-            })
+    parts = [
+        "⚠️ THRESHOLD VIOLATIONS FOUND:",
+        f"📊 {below_count} of {total_items} items below threshold",
+        "",
+    ]
 
-    if items_below:
-        summary = f"⚠️ THRESHOLD VIOLATIONS FOUND:\n"
-        summary += f"📊 {len(items_below)} of {total_items} items below threshold\n\n"
+    for i in first_k(below_mask, 5):  # Show first 5 for simplicity
+        item_id, stock, threshold, category = _example_fields(items[i])
+        parts.append(f"• {item_id}: {stock} units (threshold: {threshold}) - {category}")
 
-        for item in items_below[:5]:  # Show first 5 for simplicity
-            summary += f"• {item['item_id']}: {item['current_stock']} units "
-            summary += f"(threshold: {item['threshold']}) - {item['category']}\n"
+    if below_count > 5:
+        parts.append(f"... and {below_count - 5} more items")
 
-        if len(items_below) > 5:
-            summary += f"... and {len(items_below) - 5} more items\n"
+    parts.append("")
+    parts.append("💡 Recommendation: Prioritize restocking for these items")
+    return "\n".join(parts)
 
-        summary += f"\n💡 Recommendation: Prioritize restocking for these items"
-        return summary
-    else:
-        return f"✅ All {total_items} items are above their reorder thresholds"
+
+check_inventory_thresholds = function_tool(
+    _check_inventory_thresholds, name_override="check_inventory_thresholds"
+)
@@ -4,6 +4,8 @@ Team Member: Rhiannon
 Focus: Learning route calculation and delivery scheduling patterns.
 """
 
+from functools import lru_cache
+
 from agents import Agent, CodeInterpreterTool
 from ...config.settings import settings
 from ...models.inventory_data import InventoryContext
@@ -14,6 +16,32 @@ from .tools.route_calculator import calculate_simple_routes
 from .tools.delivery_scheduler import create_delivery_schedule
 
 
+# Agent instructions, built once at import and shared by every instance
+_INSTRUCTIONS = """You are a Route Computer agent in a multi-agent logistics system. 
+
+**Learning Focus**: Demonstrate @function_tool usage and agent coordination patterns.
+
+**Your Role**: Calculate delivery routes and schedules for items that need restocking.
+
+**Available Tools:**
+- calculate_simple_routes: Calculate basic delivery routes between suppliers and customers
+- create_delivery_schedule: Create simple delivery schedules for urgent items  
+- CodeInterpreterTool: For mathematical calculations (distances, costs, route optimization, etc.)
+
+**Agent Pattern**: You work as part of an "Agents as Tools" system where:
+1. You receive inventory data from the threshold monitor
+2. You calculate routes and schedules for items needing restocking
+3. Your results help the orchestrator coordinate the overall logistics workflow
+
+**Approach:**
+1. Use calculate_simple_routes to identify delivery paths for urgent items
+2. Use create_delivery_schedule to prioritize deliveries by urgency
+3. Use CodeInterpreter for any mathematical analysis needed (route optimization, cost calculations, etc.)
+4. Focus on clear, actionable routing recommendations
+
+Keep responses focused on route and schedule information that other agents can use."""
+
+
 @log_agent_execution
 class RouteComputer:
     """Agent for computing optimal delivery routes and scheduling."""
@@ -35,26 +63,18 @@ class RouteComputer:
 
     def _get_instructions(self) -> str:
         """Get instructions for the route computation agent."""
-        return """You are a Route Computer agent in a multi-agent logistics system. 
+        return _INSTRUCTIONS
 
-**Learning Focus**: Demonstrate @function_tool usage and agent coordination patterns.
 
-**Your Role**: Calculate delivery routes and schedules for items that need restocking.
+@lru_cache(maxsize=1)
+def get_route_computer() -> RouteComputer:
+    """
+    Get the shared route computer instance.
 
-**Available Tools:**
-- calculate_simple_routes: Calculate basic delivery routes between suppliers and customers
-- create_delivery_schedule: Create simple delivery schedules for urgent items  
-- CodeInterpreterTool: For mathematical calculations (distances, costs, route optimization, etc.)
+    The agent only holds constant instructions and tools, so one instance
+    can be reused instead of rebuilding the Agent on every construction.
 
-**Agent Pattern**: You work as part of an "Agents as Tools" system where:
-1. You receive inventory data from the threshold monitor
-2. You calculate routes and schedules for items needing restocking
-3. Your results help the orchestrator coordinate the overall logistics workflow
-
-**Approach:**
-1. Use calculate_simple_routes to identify delivery paths for urgent items
-2. Use create_delivery_schedule to prioritize deliveries by urgency
-3. Use CodeInterpreter for any mathematical analysis needed (route optimization, cost calculations, etc.)
-4. Focus on clear, actionable routing recommendations
-
-Keep responses focused on route and schedule information that other agents can use."""
+    Returns:
+        RouteComputer: Process-wide route computer agent
+    """
+    return RouteComputer()
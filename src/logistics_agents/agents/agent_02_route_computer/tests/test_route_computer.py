@@ -87,3 +87,12 @@ class TestRouteComputerTools:
         assert hasattr(calculate_simple_routes, 'description')
         assert hasattr(create_delivery_schedule, 'name')
         assert hasattr(create_delivery_schedule, 'description')
+
+    def test_city_distance_lookup(self):
+        """Test that distances are symmetric and default for unknown cities."""
+        from ..tools.route_calculator import _estimate_city_distance
+
+        assert _estimate_city_distance("Chennai", "Bangalore") == 350
+        assert _estimate_city_distance("Bangalore", "Chennai") == 350
+        assert _estimate_city_distance("Mumbai", "Bangalore") == 250
+        assert _estimate_city_distance("Kolkata", "Pune") == 250
@@ -5,37 +5,45 @@ from ....models.inventory_data import InventoryContext
 from ....utils.logging_config import log_tool_interaction
 from datetime import datetime, timedelta
 
+_LINE_FORMAT = "%s: %s (%s → %s) - %s priority"
+
 
-@function_tool
 @log_tool_interaction("DeliveryScheduler")
-def create_delivery_schedule(wrapper: RunContextWrapper[InventoryContext]) -> str:
+def _create_delivery_schedule(wrapper: RunContextWrapper[InventoryContext]) -> str:
     """Create simple delivery schedule for urgent items.
 
     Focus: Learning @function_tool patterns and basic scheduling logic.
     """
     context = wrapper.context
-    schedules = []
+    if not context.has_restock:
+        return "✅ No urgent deliveries needed"
+
+    stock = context.stock_arr
+    qty = context.qty_arr
 
-    # Get urgent items (below 20% threshold)
-    urgent_items = [
-        item for item in context.items if item.current_stock <= item.order_quantity * 0.2][:5]
+    # Get the most urgent items (below 20% threshold), most urgent first
+    urgent_idx = context.most_urgent_restock(5)
 
+    # Simple scheduling: next day + index days for different urgency
     base_date = datetime.now()
+    delivery_dates = [
+        (base_date + timedelta(days=i + 1)).strftime('%Y-%m-%d')
+        for i in range(len(urgent_idx))
+    ]
 
-    for i, item in enumerate(urgent_items):
-        # Simple scheduling: next day + index days for different urgency
-        delivery_date = base_date + timedelta(days=i+1)
+    # Simple priority based on stock percentage
+    high_priority = (stock[urgent_idx] / qty[urgent_idx]) * 100 < 10
 
-        # Simple priority based on stock percentage
-        stock_percentage = (item.current_stock / item.order_quantity) * 100
-        priority = "HIGH" if stock_percentage < 10 else "MEDIUM"
+    items = context.items
+    schedules = [
+        _LINE_FORMAT % (delivery_date, items[i].item_id, items[i].supplier_id,
+                        items[i].customer_location, "HIGH" if is_high else "MEDIUM")
+        for delivery_date, i, is_high in zip(delivery_dates, urgent_idx, high_priority)
+    ]
 
-        schedules.append(
-            f"{delivery_date.strftime('%Y-%m-%d')}: {item.item_id} "
-            f"({item.supplier_id} → {item.customer_location}) - {priority} priority"
-        )
+    return f"📅 Delivery schedule created:\n" + "\n".join(schedules)
 
-    if schedules:
-        return f"📅 Delivery schedule created:\n" + "\n".join(schedules)
-    else:
-        return "✅ No urgent deliveries needed"
+
+create_delivery_schedule = function_tool(
+    _create_delivery_schedule, name_override="create_delivery_schedule"
+)
@@ -1,50 +1,69 @@
 """Route Calculator Tool - Simplified for Course Learning."""
 
+import numpy as np
 from agents import function_tool, RunContextWrapper
 from ....models.inventory_data import InventoryContext
 from ....utils.logging_config import log_tool_interaction
 
+# Basic distance approximation between major Indian cities
+_KNOWN_DISTANCES = {
+    ("Chennai", "Bangalore"): 350,
+    ("Mumbai", "Pune"): 150,
+    ("Delhi", "Gurgaon"): 30,
+    ("Hyderabad", "Bangalore"): 570,
+    ("Chennai", "Hyderabad"): 630
+}
+_DEFAULT_DISTANCE = 250  # Default 250km
+
+_LINE_FORMAT = "%s → %s: ~%dkm (%s)"
+
+# Cities interned to small ints; any unknown city maps to the extra last
+# row/column, which holds the default distance
+_CITY_INDEX = {
+    city: i for i, city in enumerate(dict.fromkeys(
+        city for pair in _KNOWN_DISTANCES for city in pair))
+}
+_UNKNOWN_CITY = len(_CITY_INDEX)
+
+# Symmetric distance matrix for bidirectional lookup
+_CITY_DISTANCES = np.full((_UNKNOWN_CITY + 1, _UNKNOWN_CITY + 1),
+                          _DEFAULT_DISTANCE, dtype=np.int16)
+for (_city1, _city2), _distance in _KNOWN_DISTANCES.items():
+    _CITY_DISTANCES[_CITY_INDEX[_city1], _CITY_INDEX[_city2]] = _distance
+    _CITY_DISTANCES[_CITY_INDEX[_city2], _CITY_INDEX[_city1]] = _distance
+del _city1, _city2, _distance
+
 
-@function_tool
 @log_tool_interaction("RouteCalculator")
-def calculate_simple_routes(wrapper: RunContextWrapper[InventoryContext]) -> str:
+def _calculate_simple_routes(wrapper: RunContextWrapper[InventoryContext]) -> str:
     """Calculate simple delivery routes between suppliers and customers.
 
     Focus: Learning @function_tool creation and basic route logic.
     """
     context = wrapper.context
-    routes = []
-
-    # Get first 5 items that need restocking for simplicity
-    items_needing_restock = [
-        item for item in context.items if item.current_stock <= item.order_quantity * 0.2][:5]
-
-    for item in items_needing_restock:
-        # Simple distance estimation for Indian cities
-        estimated_distance = _estimate_city_distance(
-            item.location, item.customer_location)
-        routes.append(
-            f"{item.supplier_id} → {item.customer_location}: ~{estimated_distance}km ({item.item_id})")
-
-    if routes:
-        return f"🚛 Calculated {len(routes)} delivery routes:\n" + "\n".join(routes)
-    else:
+    if not context.has_restock:
         return "✅ No routes needed - all items sufficiently stocked"
 
+    items = context.items
+
+    # Get the 5 most urgent items that need restocking, with a simple
+    # distance estimation for Indian cities
+    routes = [
+        _LINE_FORMAT % (item.supplier_id, item.customer_location,
+                        _estimate_city_distance(item.location, item.customer_location),
+                        item.item_id)
+        for item in (items[i] for i in context.most_urgent_restock(5))
+    ]
+
+    return f"🚛 Calculated {len(routes)} delivery routes:\n" + "\n".join(routes)
+
 
 def _estimate_city_distance(city1: str, city2: str) -> int:
     """Simple city distance estimation for demonstration."""
-    # Basic distance approximation between major Indian cities
-    distances = {
-        ("Chennai", "Bangalore"): 350,
-        ("Mumbai", "Pune"): 150,
-        ("Delhi", "Gurgaon"): 30,
-        ("Hyderabad", "Bangalore"): 570,
-        ("Chennai", "Hyderabad"): 630
-    }
-
-    # Simple bidirectional lookup
-    key = (city1, city2)
-    reverse_key = (city2, city1)
-
-    return distances.get(key, distances.get(reverse_key, 250))  # Default 250km
+    return int(_CITY_DISTANCES[_CITY_INDEX.get(city1, _UNKNOWN_CITY),
+                               _CITY_INDEX.get(city2, _UNKNOWN_CITY)])
+
+
+calculate_simple_routes = function_tool(
+    _calculate_simple_routes, name_override="calculate_simple_routes"
+)
@@ -4,6 +4,8 @@ Team Member: Nathan
 Focus: Learning demand forecasting and quantity optimization patterns.
 """
 
+from functools import cached_property
+
 from agents import Agent, CodeInterpreterTool
 from ...config.settings import settings
 from ...models.inventory_data import InventoryContext
@@ -18,9 +20,15 @@ from .tools.quantity_optimizer import calculate_reorder_quantities
 class RestockingCalculator:
     """Agent for calculating optimal restocking quantities and timing."""
 
-    def __init__(self):
-        """Initialize the restocking calculation agent."""
-        self.agent = Agent[InventoryContext](
+    @cached_property
+    def agent(self) -> Agent[InventoryContext]:
+        """
+        Build the restocking calculation agent on first use.
+
+        Construction (including the hosted SDK tool) is deferred so that
+        creating this class is cheap when the agent is never run.
+        """
+        return Agent[InventoryContext](
             name="RestockingCalculator",
             instructions=self._get_instructions(),
             model=settings.openai_model,
@@ -26,6 +26,14 @@ class TestRestockingCalculator:
         # 2 simplified tools + CodeInterpreter
         assert len(agent.agent.tools) >= 3
 
+    def test_agent_is_built_lazily(self):
+        """Test that the SDK agent is only constructed on first access."""
+        calculator = RestockingCalculator()
+        assert "agent" not in vars(calculator)
+
+        assert calculator.agent is calculator.agent
+        assert calculator._original_agent is calculator.agent
+
     @pytest.mark.asyncio
     async def test_demand_estimation(self, agent, urgent_items_context):
         """Test demand estimation functionality."""
@@ -87,3 +95,58 @@ class TestRestockCalculatorTools:
         assert hasattr(estimate_simple_demand, 'description')
         assert hasattr(calculate_reorder_quantities, 'name')
         assert hasattr(calculate_reorder_quantities, 'description')
+
+    def test_restock_mask_matches_item_filter(self, sample_inventory_context):
+        """Test that the cached restock mask matches the per-item rule."""
+        context = sample_inventory_context
+
+        assert list(context.restock_mask) == [
+            item.current_stock <= item.order_quantity * 0.2 for item in context.items]
+        assert list(context.restock_indices) == [
+            i for i, needs_restock in enumerate(context.restock_mask) if needs_restock]
+
+    def test_eoq_batch(self):
+        """Test EOQ recommendations against the scalar formula."""
+        import math
+        from ..tools._kernels import eoq_batch
+
+        qty = [50, 200, 80]
+        stock = [5, 10, 0]
+        unit_cost = [20.0, 2.5, 0.0]
+        recommended, total_cost = eoq_batch(qty, stock, unit_cost)
+
+        # EOQ wins for the first two items; no holding cost falls back to refill
+        assert list(recommended) == [
+            int(math.sqrt(2 * 600 * 50 / 5.0)), int(math.sqrt(2 * 2400 * 50 / 0.625)), 80]
+        assert list(total_cost) == [r * c for r, c in zip(recommended, unit_cost)]
+
+    def test_demand_levels_edges(self):
+        """Test that rates exactly on a level edge stay in the lower level."""
+        from ..tools._kernels import demand_levels
+
+        rates = [0.0, 0.5, 0.51, 0.8, 0.81, 1.0]
+        assert list(demand_levels(rates)) == [
+            "LOW", "LOW", "MEDIUM", "MEDIUM", "HIGH", "HIGH"]
+
+    def test_reorder_lines_are_structured(self, sample_inventory_context):
+        """Test that reorder lines carry plain values for tool chaining."""
+        from ..tools.quantity_optimizer import reorder_lines
+
+        context = sample_inventory_context
+        lines = reorder_lines(context, limit=3)
+
+        assert len(lines) == min(3, len(context.restock_indices))
+        for line, i in zip(lines, context.most_urgent_restock(3)):
+            assert line.item_id == context.items[i].item_id
+            assert line.current_stock == context.items[i].current_stock
+            assert type(line.quantity) is int and type(line.cost) is float
+
+    def test_most_urgent_restock_orders_by_stock_left(self, sample_inventory_context):
+        """Test that restock items are ranked by remaining share of order quantity."""
+        context = sample_inventory_context
+        remaining = {i: context.items[i].current_stock / max(context.items[i].order_quantity, 1)
+                     for i in context.restock_indices}
+        expected = sorted(remaining, key=remaining.get)
+
+        assert list(context.most_urgent_restock(5)) == expected[:5]
+        assert list(context.most_urgent_restock(len(expected) + 3)) == expected
@@ -0,0 +1,68 @@
+"""Vectorized kernels shared by the restock calculator tools."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Simplified EOQ cost model
+ORDERING_COST = 50  # Flat cost per order
+HOLDING_RATE = 0.25  # Yearly holding cost as a share of unit cost
+
+# Consumption rates strictly above each edge move up one demand level
+DEMAND_LEVEL_EDGES = np.array([0.5, 0.8])
+DEMAND_LEVELS = np.array(["LOW", "MEDIUM", "HIGH"])
+
+
+def eoq_batch(
+    qty: np.ndarray, stock: np.ndarray, unit_cost: np.ndarray,
+    refill: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recommend reorder quantities for a batch of items.
+
+    Each item gets its EOQ, sqrt(2 * annual_demand * ordering_cost /
+    holding_cost), assuming the order quantity is a monthly demand. The
+    recommendation is never below what it takes to refill the order
+    quantity; items with no holding cost just get that refill amount.
+
+    Args:
+        qty: Typical order quantity per item
+        stock: Current stock level per item
+        unit_cost: Cost per unit per item
+        refill: Optional precomputed ``qty - stock`` per item
+
+    Returns:
+        Tuple of (recommended quantities, total order costs)
+    """
+    qty = np.asarray(qty, dtype=np.int64)
+    stock = np.asarray(stock, dtype=np.int64)
+    unit_cost = np.asarray(unit_cost, dtype=np.float64)
+
+    annual_demand = qty * 12  # Assume monthly order quantity
+    holding_cost = unit_cost * HOLDING_RATE
+    refill = qty - stock if refill is None else np.asarray(refill, dtype=np.int64)
+
+    # Single masked ufunc passes; items without holding cost are skipped
+    # rather than divided by zero and masked out afterwards
+    has_holding = holding_cost > 0
+    eoq = np.divide(2 * annual_demand * ORDERING_COST, holding_cost,
+                    out=np.zeros_like(holding_cost), where=has_holding)
+    np.sqrt(eoq, out=eoq)
+    eoq = eoq.astype(np.int64)
+
+    recommended = np.where(has_holding, np.maximum(eoq, refill), refill)
+    return recommended, recommended * unit_cost
+
+
+def demand_levels(consumption_rate: np.ndarray) -> np.ndarray:
+    """
+    Label consumption rates as LOW/MEDIUM/HIGH demand without branching.
+
+    Args:
+        consumption_rate: Share of the order quantity already consumed
+
+    Returns:
+        Array of demand level labels
+    """
+    # side="left" keeps a rate exactly on an edge in the lower level
+    return DEMAND_LEVELS[np.searchsorted(DEMAND_LEVEL_EDGES, consumption_rate, side="left")]
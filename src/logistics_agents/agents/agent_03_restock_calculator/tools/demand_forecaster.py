@@ -3,42 +3,42 @@
 from agents import function_tool, RunContextWrapper
 from ....models.inventory_data import InventoryContext
 from ....utils.logging_config import log_tool_interaction
+from ._kernels import demand_levels
+
+_LINE_FORMAT = "%s: %s demand (~%d units/month)"
 
 
-@function_tool
 @log_tool_interaction("DemandForecaster")
-def estimate_simple_demand(wrapper: RunContextWrapper[InventoryContext]) -> str:
+def _estimate_simple_demand(wrapper: RunContextWrapper[InventoryContext]) -> str:
     """Estimate simple demand patterns for restocking decisions.
 
     Focus: Learning @function_tool creation and basic demand analysis.
     """
     context = wrapper.context
-    demand_analysis = []
-
-    # Get items below threshold for demand estimation
-    low_stock_items = [
-        item for item in context.items if item.current_stock <= item.order_quantity * 0.2][:5]
-
-    for item in low_stock_items:
-        # Simple demand estimation based on current stock patterns
-        consumption_rate = (item.order_quantity -
-                            item.current_stock) / item.order_quantity
-
-        if consumption_rate > 0.8:
-            demand_level = "HIGH"
-        elif consumption_rate > 0.5:
-            demand_level = "MEDIUM"
-        else:
-            demand_level = "LOW"
-
-        estimated_monthly_demand = int(
-            item.order_quantity * consumption_rate * 1.2)  # 20% buffer
-
-        demand_analysis.append(
-            f"{item.item_id}: {demand_level} demand (~{estimated_monthly_demand} units/month)"
-        )
-
-    if demand_analysis:
-        return f"📊 Demand estimation for {len(demand_analysis)} items:\n" + "\n".join(demand_analysis)
-    else:
+    if not context.has_restock:
         return "✅ No high-demand items requiring immediate analysis"
+
+    items = context.items
+
+    # Get the most depleted items for demand estimation
+    low_stock_idx = context.most_urgent_restock(5)
+    qty = context.qty_arr[low_stock_idx]
+    stock = context.stock_arr[low_stock_idx]
+
+    # Simple demand estimation based on current stock patterns
+    consumption_rate = (qty - stock) / qty
+    levels = demand_levels(consumption_rate)
+    estimated_monthly_demand = (qty * consumption_rate * 1.2).astype(int)  # 20% buffer
+
+    demand_analysis = [
+        _LINE_FORMAT % (items[i].item_id, demand_level, monthly_demand)
+        for i, demand_level, monthly_demand in zip(
+            low_stock_idx, levels, estimated_monthly_demand)
+    ]
+
+    return f"📊 Demand estimation for {len(demand_analysis)} items:\n" + "\n".join(demand_analysis)
+
+
+estimate_simple_demand = function_tool(
+    _estimate_simple_demand, name_override="estimate_simple_demand"
+)
@@ -1,48 +1,67 @@
 """Quantity Optimizer Tool - Simplified for Course Learning."""
 
-import math
+from typing import List
+
 from agents import function_tool, RunContextWrapper
-from ....models.inventory_data import InventoryContext
+from ....models.inventory_data import InventoryContext, ReorderLine
 from ....utils.logging_config import log_tool_interaction
+from ._kernels import eoq_batch
+
+_LINE_FORMAT = "%s: Order %d units ($%.2f) - Current: %d"
+
+
+def reorder_lines(context: InventoryContext, limit: int = 5) -> List[ReorderLine]:
+    """
+    Build structured reorder recommendations for low-stock items.
+
+    Callers that chain tools can use these lines directly instead of
+    parsing the formatted tool output.
+
+    Args:
+        context: Inventory context to analyze
+        limit: Maximum number of items to recommend
+
+    Returns:
+        Up to ``limit`` reorder lines, most urgent first
+    """
+    items = context.items
+
+    # Get the most urgent items needing restock
+    restock_idx = context.most_urgent_restock(limit)
+
+    # Simple EOQ-inspired calculation for the whole batch at once
+    stock = context.stock_arr[restock_idx]
+    recommended, total_cost = eoq_batch(
+        context.qty_arr[restock_idx], stock, context.unit_cost_arr[restock_idx],
+        refill=context.reorder_qty_arr[restock_idx])
+
+    # Item objects are only touched for their IDs
+    return [
+        ReorderLine(items[i].item_id, quantity, cost, current_stock)
+        for i, quantity, cost, current_stock in zip(
+            restock_idx, recommended.tolist(), total_cost.tolist(), stock.tolist())
+    ]
 
 
-@function_tool
 @log_tool_interaction("QuantityOptimizer")
-def calculate_reorder_quantities(wrapper: RunContextWrapper[InventoryContext]) -> str:
+def _calculate_reorder_quantities(wrapper: RunContextWrapper[InventoryContext]) -> str:
     """Calculate simple reorder quantities for low-stock items.
 
     Focus: Learning @function_tool creation and basic EOQ concepts.
     """
     context = wrapper.context
-    reorder_recommendations = []
-
-    # Get items needing restock
-    items_to_restock = [
-        item for item in context.items if item.current_stock <= item.order_quantity * 0.2][:5]
-
-    for item in items_to_restock:
-        # Simple EOQ-inspired calculation
-        annual_demand = item.order_quantity * 12  # Assume monthly order quantity
-        holding_cost_per_unit = item.unit_cost * 0.25  # 25% holding cost
-        ordering_cost = 50  # Simplified ordering cost
-
-        # Basic EOQ formula: sqrt(2 * annual_demand * ordering_cost / holding_cost_per_unit)
-        if holding_cost_per_unit > 0:
-            eoq = int(math.sqrt(2 * annual_demand *
-                      ordering_cost / holding_cost_per_unit))
-            # Ensure minimum practical order
-            recommended_quantity = max(
-                eoq, item.order_quantity - item.current_stock)
-        else:
-            recommended_quantity = item.order_quantity - item.current_stock
-
-        total_cost = recommended_quantity * item.unit_cost
-
-        reorder_recommendations.append(
-            f"{item.item_id}: Order {recommended_quantity} units (${total_cost:.2f}) - Current: {item.current_stock}"
-        )
-
-    if reorder_recommendations:
-        return f"📦 Reorder quantity recommendations:\n" + "\n".join(reorder_recommendations)
-    else:
+    if not context.has_restock:
         return "✅ No items requiring restock calculations"
+
+    # Format only at the LLM boundary
+    reorder_recommendations = [
+        _LINE_FORMAT % (line.item_id, line.quantity, line.cost, line.current_stock)
+        for line in reorder_lines(context)
+    ]
+
+    return f"📦 Reorder quantity recommendations:\n" + "\n".join(reorder_recommendations)
+
+
+calculate_reorder_quantities = function_tool(
+    _calculate_reorder_quantities, name_override="calculate_reorder_quantities"
+)
@@ -4,6 +4,8 @@ Team Member: Anagha
 Focus: Learning supplier matching and order optimization patterns.
 """
 
+from functools import cached_property
+
 from agents import Agent, WebSearchTool
 from ...config.settings import settings
 from ...models.inventory_data import InventoryContext
@@ -17,9 +19,15 @@ from .tools.order_optimizer import calculate_consolidation_savings
 class OrderConsolidator:
     """Agent for consolidating orders and optimizing supplier groupings."""
 
-    def __init__(self):
-        """Initialize the order consolidation agent."""
-        self.agent = Agent[InventoryContext](
+    @cached_property
+    def agent(self) -> Agent[InventoryContext]:
+        """
+        Build the order consolidation agent on first use.
+
+        Construction (including the hosted SDK tool) is deferred so that
+        creating this class is cheap when the agent is never run.
+        """
+        return Agent[InventoryContext](
             name="OrderConsolidator",
             instructions=self._get_instructions(),
             model=settings.openai_model,
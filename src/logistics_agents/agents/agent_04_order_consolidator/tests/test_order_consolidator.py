@@ -88,3 +88,44 @@ class TestOrderConsolidatorTools:
         assert hasattr(group_orders_by_supplier, 'description')
         assert hasattr(calculate_consolidation_savings, 'name')
         assert hasattr(calculate_consolidation_savings, 'description')
+
+    def test_restock_groups_keep_first_appearance(self, sample_inventory_context):
+        """Test that restock groups follow supplier first appearance."""
+        context = sample_inventory_context
+        restock = context.restock_groups
+
+        expected = {}
+        for i in context.restock_indices:
+            item = context.items[i]
+            expected.setdefault(item.supplier_id, set()).add(item.location)
+
+        assert restock.supplier_ids == list(expected)
+        assert list(restock.location_counts) == [len(locs) for locs in expected.values()]
+        assert restock.counts.sum() == len(context.restock_indices)
+
+    def test_supplier_codes_follow_first_appearance(self, sample_inventory_context):
+        """Test that supplier codes decode back to every item's supplier."""
+        context = sample_inventory_context
+        codes, supplier_ids = context.supplier_codes
+
+        assert supplier_ids == list(dict.fromkeys(item.supplier_id for item in context.items))
+        assert [supplier_ids[code] for code in codes] == [
+            item.supplier_id for item in context.items]
+        assert context.get_summary_stats()["total_suppliers"] == len(supplier_ids)
+
+        expected = {}
+        for item in context.items:
+            expected.setdefault(item.supplier_id, []).append(item)
+        assert context.items_by_supplier == expected
+        assert list(context.items_by_supplier) == list(expected)
+
+    def test_consolidation_savings(self):
+        """Test shipping savings plus the volume discount over $500."""
+        import numpy as np
+        from ..tools._kernels import consolidation_savings
+
+        savings = consolidation_savings(
+            np.array([2, 3, 1]), np.array([400.0, 1000.0, 900.0]))
+
+        # Single-item suppliers can't be consolidated
+        assert list(savings) == [10, 35 + 20.0, 0]
@@ -0,0 +1,34 @@
+"""Vectorized kernels shared by the order consolidator tools."""
+
+import numpy as np
+
+# Simple consolidation savings model
+INDIVIDUAL_SHIPMENT_COST = 25  # $25 per individual shipment
+CONSOLIDATED_SHIPMENT_COST = 40  # $40 for consolidated shipment
+VOLUME_DISCOUNT_THRESHOLD = 500  # Orders over $500...
+VOLUME_DISCOUNT_RATE = 0.02  # ...get a 2% discount
+
+
+def consolidation_savings(
+    counts: np.ndarray, order_values: np.ndarray
+) -> np.ndarray:
+    """
+    Estimate savings from consolidating each supplier's items.
+
+    Only suppliers with more than one item can be consolidated; the others
+    get zero savings.
+
+    Args:
+        counts: Number of items per supplier
+        order_values: Total order value per supplier
+
+    Returns:
+        Shipping savings plus volume discount per supplier
+    """
+    multi_item = counts > 1
+    shipping_savings = np.where(
+        multi_item, counts * INDIVIDUAL_SHIPMENT_COST - CONSOLIDATED_SHIPMENT_COST, 0)
+    volume_discount = np.where(
+        multi_item & (order_values > VOLUME_DISCOUNT_THRESHOLD),
+        order_values * VOLUME_DISCOUNT_RATE, 0)
+    return shipping_savings + volume_discount
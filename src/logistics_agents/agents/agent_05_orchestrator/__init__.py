@@ -4,6 +4,6 @@ Team Member: Andy
 Agent Purpose: Coordinate all agents and synthesize comprehensive restocking plan
 """
 
-from .agent import InventoryOrchestrator
+from .agent import InventoryOrchestrator, get_orchestrator
 
-__all__ = ["InventoryOrchestrator"]
+__all__ = ["InventoryOrchestrator", "get_orchestrator"]
@@ -4,67 +4,26 @@ Team Member: Andy
 Focus: Learning orchestration patterns and multi-agent coordination.
 """
 
-from agents import Agent
+import asyncio
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Literal, Tuple
+
+from agents import Agent, FunctionTool, RunContextWrapper, Runner, function_tool
 
 from ...config.settings import settings
 from ...models.inventory_data import InventoryContext
 from ...utils.agent_runner import log_agent_execution
 
-# Import all specialist agents for orchestration
-from ..agent_01_threshold_monitor.agent import InventoryThresholdMonitor
-from ..agent_02_route_computer.agent import RouteComputer
-from ..agent_03_restock_calculator.agent import RestockingCalculator
-from ..agent_04_order_consolidator.agent import OrderConsolidator
-
 # Import orchestrator tools
-from .tools.agent_coordinator import coordinate_workflow_steps
-from .tools.result_synthesizer import create_executive_summary
-
+from .tools.agent_coordinator import (
+    coordinate_workflow_steps, workflow_dependencies, workflow_levels)
+from .tools.result_synthesizer import _create_executive_summary, create_executive_summary
 
-@log_agent_execution
-class InventoryOrchestrator:
-    """Orchestrator agent that coordinates all logistics agents using Agents as Tools pattern."""
 
-    def __init__(self):
-        """Initialize the orchestrator and all specialist agents."""
-        # Initialize specialist agents for orchestration
-        self.threshold_monitor = InventoryThresholdMonitor()
-        self.route_computer = RouteComputer()
-        self.restock_calculator = RestockingCalculator()
-        self.order_consolidator = OrderConsolidator()
-
-        # Create the orchestrator agent
-        self.agent = Agent[InventoryContext](
-            name="InventoryOrchestrator",
-            instructions=self._get_instructions(),
-            model=settings.openai_model,
-            tools=[
-                coordinate_workflow_steps,
-                create_executive_summary,
-                # Add specialist agents as tools (Agents as Tools Pattern)
-                self.threshold_monitor.agent.as_tool(
-                    tool_name="InventoryThresholdMonitor",
-                    tool_description="Monitor inventory thresholds and identify items below reorder points with priority classification",
-                ),
-                self.route_computer.agent.as_tool(
-                    tool_name="RouteComputer",
-                    tool_description="Compute optimal delivery routes for restocking operations with time and cost optimization",
-                ),
-                self.restock_calculator.agent.as_tool(
-                    tool_name="RestockingCalculator",
-                    tool_description="Calculate optimal restocking quantities using EOQ, demand forecasting, and inventory optimization",
-                ),
-                self.order_consolidator.agent.as_tool(
-                    tool_name="OrderConsolidator",
-                    tool_description="Consolidate orders and optimize shipping efficiency for maximum cost savings",
-                ),
-            ],
-            output_type=str,  # Use simple string output for course learning
-        )
-
-    def _get_instructions(self) -> str:
-        """Get the agent instructions for advanced multi-agent coordination."""
-        return """You are the Inventory Orchestrator demonstrating advanced "Agents as Tools" patterns with sophisticated coordination.
+# Agent instructions, built once at import and shared by every instance.
+# They are fully static, so every run sends the same prompt prefix and the
+# provider's automatic prompt caching can reuse it
+_INSTRUCTIONS = """You are the Inventory Orchestrator demonstrating advanced "Agents as Tools" patterns with sophisticated coordination.
 
 **Learning Focus**: Master advanced multi-agent coordination with parallel execution, result validation, and performance optimization.
 
@@ -76,7 +35,7 @@ class InventoryOrchestrator:
 2. **EXECUTE SPECIALIST AGENTS** in the optimal sequence determined by the coordinator
 3. **ALWAYS END** with create_executive_summary to synthesize results with advanced validation
 
-**Specialist Agents Available (as Tools):**
+**Specialist Agents Available (call by name with run_specialist or run_specialists_parallel):**
 1. **InventoryThresholdMonitor**: Identifies items below reorder thresholds with priority classification
 2. **RouteComputer**: Calculates delivery routes and schedules for restocking operations  
 3. **RestockingCalculator**: Analyzes demand patterns and calculates optimal reorder quantities
@@ -85,6 +44,8 @@ class InventoryOrchestrator:
 **Orchestration Tools (MUST USE BOTH):**
 - coordinate_workflow_steps: Advanced dependency management, parallel execution planning, and quality control checkpoints
 - create_executive_summary: Sophisticated result synthesis with cross-agent validation and confidence scoring
+- run_specialist: Run one specialist agent by name with an input describing its task
+- run_specialists_parallel: Run several independent specialist agents at once (pass their names and one shared input); use it instead of calling those agents one by one
 
 **Advanced Coordination Patterns:**
 
@@ -109,10 +70,11 @@ class InventoryOrchestrator:
 - Identify patterns in multi-agent coordination success and optimization opportunities
 
 **Conditional Orchestration Logic:**
-- HIGH URGENCY scenarios: Parallel threshold + route analysis → immediate consolidation
-- MEDIUM URGENCY scenarios: Parallel threshold + quantity analysis → optimized routes → consolidation  
-- LOW URGENCY scenarios: Full parallel analysis → optimization-focused consolidation → efficiency routes
-- MAINTENANCE scenarios: Comprehensive parallel analysis → supplier relationship optimization
+- HIGH URGENCY scenarios: run_specialists_parallel(["InventoryThresholdMonitor", "RouteComputer"]) → immediate consolidation
+- MEDIUM URGENCY scenarios: run_specialists_parallel(["InventoryThresholdMonitor", "RestockingCalculator"]) → optimized routes → consolidation  
+- LOW URGENCY scenarios: run_specialists_parallel with all four specialists → optimization-focused consolidation → efficiency routes
+- MAINTENANCE scenarios: run_specialists_parallel with all four specialists → supplier relationship optimization
+- Use run_specialist only when just one agent's analysis is needed
 
 **Advanced Decision Framework:**
 1. Use coordinate_workflow_steps to analyze dependencies and plan parallel execution
@@ -147,3 +109,272 @@ class InventoryOrchestrator:
 - Understand the value of confidence scoring and quality assurance in orchestration
 
 **CRITICAL**: You MUST use coordinate_workflow_steps first, then the specialist agents, then create_executive_summary. Do not provide direct answers without using these tools. Focus on advanced coordination intelligence, parallel execution optimization, sophisticated result validation, and performance-measured executive reporting that showcases the full power of advanced "Agents as Tools" patterns."""
+
+SpecialistName = Literal[
+    "InventoryThresholdMonitor", "RouteComputer", "RestockingCalculator", "OrderConsolidator"
+]
+
+# (name, orchestrator attribute, description) of each specialist agent
+# reachable through the dispatch tools
+_SPECIALISTS = (
+    ("InventoryThresholdMonitor", "threshold_monitor",
+     "Monitor inventory thresholds and identify items below reorder points with priority classification"),
+    ("RouteComputer", "route_computer",
+     "Compute optimal delivery routes for restocking operations with time and cost optimization"),
+    ("RestockingCalculator", "restock_calculator",
+     "Calculate optimal restocking quantities using EOQ, demand forecasting, and inventory optimization"),
+    ("OrderConsolidator", "order_consolidator",
+     "Consolidate orders and optimize shipping efficiency for maximum cost savings"),
+)
+
+_RUN_SPECIALIST_DESCRIPTION = (
+    "Run one specialist agent on the current inventory and return its analysis. "
+    "Specialists: " + "; ".join(f"{name}: {description}"
+                                for name, _, description in _SPECIALISTS)
+)
+
+
+@log_agent_execution
+class InventoryOrchestrator:
+    """Orchestrator agent that coordinates all logistics agents using Agents as Tools pattern."""
+
+    @classmethod
+    async def create(cls) -> "InventoryOrchestrator":
+        """
+        Build an orchestrator and all its agents without blocking the event loop.
+
+        The specialist packages are imported and their agents built one
+        after another in a single worker thread, followed by the
+        orchestrator agent that wraps them.
+
+        Returns:
+            InventoryOrchestrator: Orchestrator with its agent already built
+        """
+        orchestrator = cls()
+
+        def build() -> None:
+            for _name, attr, _description in _SPECIALISTS:
+                _ = getattr(orchestrator, attr).agent
+            _ = orchestrator.agent
+
+        await asyncio.to_thread(build)
+        return orchestrator
+
+    # Specialist agents are imported and built on first use, so importing
+    # this module does not pull in all four agent packages
+
+    @cached_property
+    def threshold_monitor(self) -> Any:
+        """Shared threshold monitor specialist."""
+        from ..agent_01_threshold_monitor.agent import get_threshold_monitor
+        return get_threshold_monitor()
+
+    @cached_property
+    def route_computer(self) -> Any:
+        """Shared route computer specialist."""
+        from ..agent_02_route_computer.agent import get_route_computer
+        return get_route_computer()
+
+    @cached_property
+    def restock_calculator(self) -> Any:
+        """Restocking calculator specialist."""
+        from ..agent_03_restock_calculator.agent import RestockingCalculator
+        return RestockingCalculator()
+
+    @cached_property
+    def order_consolidator(self) -> Any:
+        """Order consolidator specialist."""
+        from ..agent_04_order_consolidator.agent import OrderConsolidator
+        return OrderConsolidator()
+
+    @cached_property
+    def _specialists(self) -> Dict[str, Any]:
+        """Specialists by name, for the dispatch tools."""
+        return {name: getattr(self, attr) for name, attr, _ in _SPECIALISTS}
+
+    @cached_property
+    def _workflow_steps(self) -> Dict[str, Callable[[RunContextWrapper[InventoryContext]], str]]:
+        """
+        Plain tool callables by workflow step name, for ``run_workflow``.
+
+        Each tool module keeps its undecorated ``_name`` function next to the
+        ``function_tool`` wrapper, so the steps run directly without going
+        through the LLM tool-call machinery.
+        """
+        from ..agent_01_threshold_monitor.tools.priority_classifier import _classify_item_priority
+        from ..agent_01_threshold_monitor.tools.threshold_checker import _check_inventory_thresholds
+        from ..agent_02_route_computer.tools.delivery_scheduler import _create_delivery_schedule
+        from ..agent_02_route_computer.tools.route_calculator import _calculate_simple_routes
+        from ..agent_03_restock_calculator.tools.demand_forecaster import _estimate_simple_demand
+        from ..agent_03_restock_calculator.tools.quantity_optimizer import (
+            _calculate_reorder_quantities)
+        from ..agent_04_order_consolidator.tools.order_optimizer import (
+            _calculate_consolidation_savings)
+        from ..agent_04_order_consolidator.tools.supplier_matcher import _group_orders_by_supplier
+
+        return {
+            "threshold_monitor": _check_inventory_thresholds,
+            "priority_classifier": _classify_item_priority,
+            "supplier_matcher": _group_orders_by_supplier,
+            "demand_forecaster": _estimate_simple_demand,
+            "route_calculator": _calculate_simple_routes,
+            "quantity_optimizer": _calculate_reorder_quantities,
+            "delivery_scheduler": _create_delivery_schedule,
+            "order_optimizer": _calculate_consolidation_savings,
+            "result_synthesizer": _create_executive_summary,
+        }
+
+    @cached_property
+    def agent(self) -> Agent[InventoryContext]:
+        """
+        Build the orchestrator agent on first use.
+
+        The specialist agents it dispatches to are imported and built here
+        too, so creating this class does not construct any of them.
+        """
+        return Agent[InventoryContext](
+            name="InventoryOrchestrator",
+            instructions=self._get_instructions(),
+            model=settings.openai_model,
+            tools=[
+                coordinate_workflow_steps,
+                create_executive_summary,
+                # One dispatch tool per call shape keeps the tool schemas
+                # sent with every request small (Agents as Tools Pattern)
+                *self._specialist_tools(),
+            ],
+            output_type=str,  # Use simple string output for course learning
+        )
+
+    async def orchestrate_batch(
+        self, contexts: List[InventoryContext], input: str
+    ) -> List[Any]:
+        """
+        Run the orchestrator over several inventory contexts concurrently.
+
+        Runs overlap their LLM round-trips, with at most
+        ``settings.concurrent_agents`` in flight at once.
+
+        Args:
+            contexts: Inventory contexts to analyze
+            input: Task description used for every context
+
+        Returns:
+            Run results in the same order as ``contexts``
+        """
+        for context in contexts:
+            context.precompute()
+        limit = asyncio.Semaphore(max(1, settings.concurrent_agents))
+
+        async def run_one(context: InventoryContext) -> Any:
+            async with limit:
+                return await Runner.run(self.agent, input=input, context=context)
+
+        return list(await asyncio.gather(*(run_one(context) for context in contexts)))
+
+    async def run_workflow(self, context: InventoryContext) -> Dict[str, str]:
+        """
+        Run every workflow step directly, each as soon as its inputs are ready.
+
+        Every step waits only on its own dependencies from
+        ``workflow_dependencies`` rather than on a whole level, so one slow
+        step does not hold up unrelated ones. Steps run in worker threads,
+        at most ``settings.concurrent_agents`` at once. No LLM is involved.
+
+        Args:
+            context: Inventory context to analyze
+
+        Returns:
+            Step outputs keyed by step name, in ``workflow_levels`` order
+        """
+        # Build the shared arrays up front so the threads only read them
+        context.precompute()
+        wrapper = RunContextWrapper(context=context)
+        steps = self._workflow_steps
+        dependencies = workflow_dependencies()
+
+        finished = {name: asyncio.Event() for name in dependencies}
+        limit = asyncio.Semaphore(max(1, settings.concurrent_agents))
+        results: Dict[str, str] = {}
+
+        async def run_step(name: str) -> None:
+            for dependency in dependencies[name]:
+                await finished[dependency].wait()
+            async with limit:
+                results[name] = await asyncio.to_thread(steps[name], wrapper)
+            finished[name].set()
+
+        # A failing step cancels the rest instead of leaving them waiting
+        async with asyncio.TaskGroup() as group:
+            for name in dependencies:
+                group.create_task(run_step(name))
+
+        return {name: results[name] for level in workflow_levels() for name in level}
+
+    def _specialist_tools(self) -> Tuple[FunctionTool, FunctionTool]:
+        """Build the tools that run one or several specialist agents by name."""
+        specialists = self._specialists
+
+        @function_tool(name_override="run_specialist",
+                       description_override=_RUN_SPECIALIST_DESCRIPTION)
+        async def run_specialist(
+            wrapper: RunContextWrapper[InventoryContext], name: SpecialistName, input: str
+        ) -> str:
+            """Run one specialist agent.
+
+            Args:
+                name: Specialist agent to run
+                input: Task description for the agent
+            """
+            if name not in specialists:
+                return (f"❌ Unknown specialist agent: {name}. "
+                        f"Available: {', '.join(specialists)}")
+
+            result = await Runner.run(specialists[name].agent, input=input, context=wrapper.context)
+            return str(result.final_output)
+
+        @function_tool(name_override="run_specialists_parallel")
+        async def run_specialists_parallel(
+            wrapper: RunContextWrapper[InventoryContext], agents: List[SpecialistName], input: str
+        ) -> str:
+            """Run independent specialist agents at the same time and return all their results.
+
+            Args:
+                agents: Names of the specialist agents to run, e.g. ["InventoryThresholdMonitor", "RouteComputer"]
+                input: Task description given to every selected agent
+            """
+            names = list(dict.fromkeys(agents))
+            unknown = [name for name in names if name not in specialists]
+            if unknown:
+                return (f"❌ Unknown specialist agents: {', '.join(unknown)}. "
+                        f"Available: {', '.join(specialists)}")
+
+            # Each specialist waits on its own LLM round-trips; overlap them
+            wrapper.context.precompute()
+            results = await asyncio.gather(*(
+                Runner.run(specialists[name].agent, input=input, context=wrapper.context)
+                for name in names
+            ))
+
+            return "\n\n".join(
+                f"## {name}\n{result.final_output}" for name, result in zip(names, results))
+
+        return run_specialist, run_specialists_parallel
+
+    def _get_instructions(self) -> str:
+        """Get the agent instructions for advanced multi-agent coordination."""
+        return _INSTRUCTIONS
+
+
+@lru_cache(maxsize=1)
+def get_orchestrator() -> InventoryOrchestrator:
+    """
+    Get the shared orchestrator instance.
+
+    Building the orchestrator wires up all four specialists and their tool
+    wrappers, so one instance is reused instead of rebuilding per request.
+
+    Returns:
+        InventoryOrchestrator: Process-wide orchestrator agent
+    """
+    return InventoryOrchestrator()
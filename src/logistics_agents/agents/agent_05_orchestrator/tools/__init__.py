@@ -1,9 +1,11 @@
 """Agent 05 Orchestrator Tools Package - Simplified for Course Learning."""
 
-from .agent_coordinator import coordinate_workflow_steps
+from .agent_coordinator import coordinate_workflow_steps, workflow_dependencies, workflow_levels
 from .result_synthesizer import create_executive_summary
 
 __all__ = [
     "coordinate_workflow_steps",
-    "create_executive_summary"
+    "create_executive_summary",
+    "workflow_dependencies",
+    "workflow_levels"
 ]
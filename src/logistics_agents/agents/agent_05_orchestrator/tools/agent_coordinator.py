@@ -2,12 +2,239 @@
 Agent Coordinator Tool - Advanced multi-agent orchestration with dependency management.
 """
 
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
 from agents import RunContextWrapper, function_tool
 
 from ....models.inventory_data import InventoryContext
+from ....utils.helpers import specialize_template
 from ....utils.logging_config import log_tool_interaction
 
 
+# Advanced dependency mapping for 6 agents
+_AGENT_DEPENDENCIES = {
+    "threshold_monitor": (),  # Independent - can run first
+    "priority_classifier": ("threshold_monitor",),  # Needs threshold results
+    "supplier_matcher": (),  # Independent - can run parallel with threshold
+    "demand_forecaster": (),  # Independent - can run parallel
+    "route_calculator": ("threshold_monitor",),  # Needs items to route
+    "quantity_optimizer": ("threshold_monitor", "demand_forecaster"),  # Needs both
+    "delivery_scheduler": ("route_calculator",),  # Needs routes
+    "order_optimizer": (
+        "quantity_optimizer",
+        "supplier_matcher",
+    ),  # Needs quantities and suppliers
+    "result_synthesizer": (
+        "quantity_optimizer",
+        "route_calculator",
+        "order_optimizer",
+    ),  # Needs all results
+}
+
+
+def _topological_levels(
+    dependencies: Mapping[str, Tuple[str, ...]]
+) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Group agents into execution levels with Kahn's algorithm.
+
+    Every agent lands in the earliest level after all of its dependencies,
+    so each level is a set of agents that can run simultaneously.
+
+    Args:
+        dependencies: Mapping of agent name to the agents it depends on
+
+    Returns:
+        Tuple of levels, each a tuple of agent names in declaration order
+    """
+    indegree = {name: len(deps) for name, deps in dependencies.items()}
+    dependents: Dict[str, List[str]] = {name: [] for name in dependencies}
+    for name, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(name)
+
+    levels: List[Tuple[str, ...]] = []
+    ready = [name for name, count in indegree.items() if count == 0]
+    while ready:
+        levels.append(tuple(ready))
+        unlocked = set()
+        for name in ready:
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    unlocked.add(dependent)
+        ready = [name for name in dependencies if name in unlocked]
+
+    if sum(len(level) for level in levels) != len(dependencies):
+        raise ValueError("Agent dependencies contain a cycle")
+    return tuple(levels)
+
+
+def _critical_path(
+    dependencies: Mapping[str, Tuple[str, ...]],
+    levels: Tuple[Tuple[str, ...], ...],
+) -> Tuple[str, ...]:
+    """
+    Find the longest dependency chain through the workflow.
+
+    Walks the steps in level order so every dependency's chain length is
+    known before its dependents are visited.
+
+    Args:
+        dependencies: Mapping of agent name to the agents it depends on
+        levels: Execution levels from ``_topological_levels``
+
+    Returns:
+        Tuple of agent names along the longest chain, first step first
+    """
+    length: Dict[str, int] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for level in levels:
+        for name in level:
+            deps = dependencies[name]
+            # Ties go to the dependency declared first
+            longest = max(deps, key=length.__getitem__, default=None)
+            length[name] = 1 + (length[longest] if longest else 0)
+            previous[name] = longest
+
+    step: Optional[str] = max(length, key=length.__getitem__)
+    path: List[str] = []
+    while step:
+        path.append(step)
+        step = previous[step]
+    return tuple(reversed(path))
+
+
+# Parallel execution groups for optimal coordination, derived from the
+# dependency map so the two cannot drift apart
+_PARALLEL_GROUPS = _topological_levels(_AGENT_DEPENDENCIES)
+_MAX_PARALLEL = max(len(group) for group in _PARALLEL_GROUPS)
+_DEPENDENCY_VIEW = MappingProxyType(_AGENT_DEPENDENCIES)
+
+# No schedule can finish faster than its longest dependency chain
+_CRITICAL_PATH = _critical_path(_AGENT_DEPENDENCIES, _PARALLEL_GROUPS)
+
+_LEVEL_NAMES = ("First", "Second", "Third", "Fourth", "Fifth", "Sixth", "Seventh")
+
+# Quality control checkpoints
+_QUALITY_CHECKPOINTS = (
+    "✅ Verify quantity calculations don't exceed storage capacity",
+    "✅ Ensure route costs align with consolidation savings",
+    "✅ Validate supplier capacity against order quantities",
+    "✅ Check lead times against urgency requirements",
+    "✅ Cross-validate demand forecasts with historical patterns",
+    "✅ Confirm delivery schedules meet business timelines",
+)
+_QUALITY_BLOCK = "\n".join(_QUALITY_CHECKPOINTS)
+
+# Performance metrics; these only depend on the plan above, so they are
+# worked out once at import
+_AVERAGE_STEP_TIME = 2.5  # Average 2.5s per agent
+_SEQUENTIAL_TIME_ESTIMATE = len(_AGENT_DEPENDENCIES) * _AVERAGE_STEP_TIME
+_PARALLEL_TIME_ESTIMATE = len(_CRITICAL_PATH) * _AVERAGE_STEP_TIME
+_EFFICIENCY_IMPROVEMENT = (
+    (_SEQUENTIAL_TIME_ESTIMATE - _PARALLEL_TIME_ESTIMATE) / _SEQUENTIAL_TIME_ESTIMATE
+) * 100
+_DEPENDENCY_DEPTH = len(_PARALLEL_GROUPS) - 1
+
+_PERFORMANCE_RISK_FACTORS = tuple(
+    risk for applies, risk in (
+        (len(_PARALLEL_GROUPS) > 3, "⚡ Complex coordination - monitor sync points"),
+        (_EFFICIENCY_IMPROVEMENT < 30, "📊 Limited parallelization benefits"),
+    ) if applies
+)
+
+
+def workflow_dependencies() -> Mapping[str, Tuple[str, ...]]:
+    """
+    Get the workflow steps each step has to wait for.
+
+    Returns:
+        Read-only mapping of step name to the names of its dependencies
+    """
+    return _DEPENDENCY_VIEW
+
+
+def workflow_levels() -> Tuple[Tuple[str, ...], ...]:
+    """
+    Get the workflow steps grouped into dependency levels.
+
+    This is the machine-readable form of the plan described by
+    ``coordinate_workflow_steps``: every step in a level only depends on
+    steps in earlier levels, so each level can run concurrently.
+
+    Returns:
+        Tuple of levels, each a tuple of step names
+    """
+    return _PARALLEL_GROUPS
+
+
+def _parallel_groups_block() -> str:
+    """Dependency mapping section of the plan."""
+    lines = [
+        "📊 DEPENDENCY MAPPING & PARALLEL EXECUTION:",
+        f"• Parallel Groups: {len(_PARALLEL_GROUPS)} execution phases",
+        f"• Group 1 (Independent): {', '.join(_PARALLEL_GROUPS[0])} - Run simultaneously",
+    ]
+    for number, group in enumerate(_PARALLEL_GROUPS[1:-1], start=2):
+        lines.append(
+            f"• Group {number} ({_LEVEL_NAMES[number - 2]}-level): "
+            f"{', '.join(group)} - After Group {number - 1}"
+        )
+    if len(_PARALLEL_GROUPS) > 1:
+        lines.append(
+            f"• Group {len(_PARALLEL_GROUPS)} (Synthesis): "
+            f"{', '.join(_PARALLEL_GROUPS[-1])} - Final integration"
+        )
+    return "\n".join(lines)
+
+
+def _checkpoints_block() -> str:
+    """Quality checkpoint and coordination metric sections of the plan."""
+    return f"""🎯 QUALITY CONTROL CHECKPOINTS:
+{_QUALITY_BLOCK}
+
+📈 COORDINATION METRICS:
+• Dependency Complexity: {_DEPENDENCY_DEPTH} max depth
+• Parallel Potential: {_MAX_PARALLEL} simultaneous agents max
+• Quality Gates: {len(_QUALITY_CHECKPOINTS)} validation points
+• Sync Points: {len(_PARALLEL_GROUPS)} coordination phases"""
+
+
+# Plan layout. Everything that only depends on the dependency map is
+# filled in once at import, leaving the per-call {fields} for format_map
+_TEMPLATE = specialize_template(
+    """AgentCoordinator | SUCCESS | 🎯 ADVANCED ORCHESTRATION PLAN for {total} items:
+
+$groups
+
+⚡ PERFORMANCE OPTIMIZATION:
+• Workflow Strategy: {strategy}
+• Coordination Pattern: {pattern}
+• Efficiency Improvement: $efficiency% vs sequential
+• Estimated Execution: ${parallel_time}s (vs ${sequential_time}s sequential)
+• Critical Path: $critical_path ($critical_steps steps)
+
+$checkpoints
+
+🚨 RISK ASSESSMENT:
+• Business Risks: {business_risks}
+• Performance Risks: $performance_risks
+
+🔄 ORCHESTRATION STATUS: {below} items flagged for advanced coordination""",
+    groups=_parallel_groups_block(),
+    efficiency=f"{_EFFICIENCY_IMPROVEMENT:.1f}",
+    parallel_time=f"{_PARALLEL_TIME_ESTIMATE:.1f}",
+    sequential_time=f"{_SEQUENTIAL_TIME_ESTIMATE:.1f}",
+    critical_path=" → ".join(_CRITICAL_PATH),
+    critical_steps=len(_CRITICAL_PATH),
+    checkpoints=_checkpoints_block(),
+    performance_risks="; ".join(_PERFORMANCE_RISK_FACTORS) or "Optimal coordination efficiency",
+)
+
+
 @function_tool
 @log_tool_interaction("AgentCoordinator")
 def coordinate_workflow_steps(wrapper: RunContextWrapper[InventoryContext]) -> str:
@@ -23,85 +250,23 @@ def coordinate_workflow_steps(wrapper: RunContextWrapper[InventoryContext]) -> s
     context = wrapper.context
 
     total_items = len(context.items)
-    below_threshold = len(context.items_below_threshold)
-
-    # Advanced dependency mapping for 6 agents
-    agent_dependencies = {
-        "threshold_monitor": [],  # Independent - can run first
-        "priority_classifier": ["threshold_monitor"],  # Needs threshold results
-        "supplier_matcher": [],  # Independent - can run parallel with threshold
-        "demand_forecaster": [],  # Independent - can run parallel
-        "route_calculator": ["threshold_monitor"],  # Needs items to route
-        "quantity_optimizer": ["threshold_monitor", "demand_forecaster"],  # Needs both
-        "delivery_scheduler": ["route_calculator"],  # Needs routes
-        "order_optimizer": [
-            "quantity_optimizer",
-            "supplier_matcher",
-        ],  # Needs quantities and suppliers
-        "result_synthesizer": [
-            "quantity_optimizer",
-            "route_calculator",
-            "order_optimizer",
-        ],  # Needs all results
-    }
-
-    # Parallel execution groups for optimal coordination
-    parallel_groups = [
-        # Group 1: Independent agents (can run simultaneously)
-        ["threshold_monitor", "supplier_matcher", "demand_forecaster"],
-        # Group 2: First-level dependent agents
-        ["priority_classifier", "route_calculator"],
-        # Group 3: Second-level dependent agents
-        ["quantity_optimizer", "delivery_scheduler"],
-        # Group 4: Final integration
-        ["order_optimizer"],
-        # Group 5: Result synthesis
-        ["result_synthesizer"],
-    ]
 
-    # Quality control checkpoints
-    quality_checkpoints = [
-        "✅ Verify quantity calculations don't exceed storage capacity",
-        "✅ Ensure route costs align with consolidation savings",
-        "✅ Validate supplier capacity against order quantities",
-        "✅ Check lead times against urgency requirements",
-        "✅ Cross-validate demand forecasts with historical patterns",
-        "✅ Confirm delivery schedules meet business timelines",
-    ]
-
-    # Performance metrics calculation
-    sequential_time_estimate = len(agent_dependencies) * 2.5  # Average 2.5s per agent
-    parallel_time_estimate = len(parallel_groups) * 3.0  # 3s per group
-    efficiency_improvement = (
-        (sequential_time_estimate - parallel_time_estimate) / sequential_time_estimate
-    ) * 100
+    # Urgency counts for risk assessment and workflow selection, from the
+    # context's cached stock/threshold arrays
+    stock = context.stock_arr
+    threshold = context.threshold_arr
+    below_threshold = int(np.count_nonzero(context.below_threshold_mask))
+    urgent_items = int(np.count_nonzero(stock <= threshold * 0.8))
+    critical_items = int(np.count_nonzero(context.critical_mask))
 
-    # Business and performance risk assessment
+    # Business risk assessment
     business_risk_factors = []
-    performance_risk_factors = []
 
     if below_threshold > total_items * 0.1:
         business_risk_factors.append("🔴 HIGH stockout risk - >10% items critical")
     if below_threshold > total_items * 0.05:
         business_risk_factors.append("🟡 MEDIUM supply chain stress")
 
-    if len(parallel_groups) > 3:
-        performance_risk_factors.append("⚡ Complex coordination - monitor sync points")
-    if efficiency_improvement < 30:
-        performance_risk_factors.append("📊 Limited parallelization benefits")
-
-    # Advanced urgency analysis for workflow selection
-    critical_items = sum(
-        1
-        for item in context.items
-        if item.current_stock <= item.reorder_threshold * 0.5
-    )
-    urgent_items = sum(
-        1
-        for item in context.items
-        if item.current_stock <= item.reorder_threshold * 0.8
-    )
-
     # Determine advanced workflow strategy
     if critical_items > total_items * 0.15:  # >15% critical
         workflow_strategy = "🚨 URGENT PARALLEL RESPONSE"
@@ -113,45 +278,11 @@ def coordinate_workflow_steps(wrapper: RunContextWrapper[InventoryContext]) -> s
         workflow_strategy = "💰 OPTIMIZATION-FOCUSED PARALLEL"
         coordination_pattern = "Full parallel analysis with performance optimization"
 
-    # Comprehensive performance metrics
-    coordination_metrics = {
-        "execution_time_estimate": f"{parallel_time_estimate:.1f}s",
-        "parallel_efficiency": f"{efficiency_improvement:.1f}%",
-        "coordination_complexity": f"{len(agent_dependencies)} agents, {len(parallel_groups)} groups",
-        "quality_checkpoints": len(quality_checkpoints),
-        "dependency_depth": max(len(deps) for deps in agent_dependencies.values()),
-        "parallel_potential": f"{len(parallel_groups[0])} simultaneous agents max",
-    }
-
-    result = f"""AgentCoordinator | SUCCESS | 🎯 ADVANCED ORCHESTRATION PLAN for {total_items} items:
-
-📊 DEPENDENCY MAPPING & PARALLEL EXECUTION:
-• Parallel Groups: {len(parallel_groups)} execution phases
-• Group 1 (Independent): {', '.join(parallel_groups[0])} - Run simultaneously
-• Group 2 (First-level): {', '.join(parallel_groups[1])} - After Group 1
-• Group 3 (Second-level): {', '.join(parallel_groups[2])} - After Group 2
-• Group 4 (Integration): {', '.join(parallel_groups[3])} - After Group 3
-• Group 5 (Synthesis): {', '.join(parallel_groups[4])} - Final integration
-
-⚡ PERFORMANCE OPTIMIZATION:
-• Workflow Strategy: {workflow_strategy}
-• Coordination Pattern: {coordination_pattern}
-• Efficiency Improvement: {efficiency_improvement:.1f}% vs sequential
-• Estimated Execution: {parallel_time_estimate:.1f}s (vs {sequential_time_estimate:.1f}s sequential)
-
-🎯 QUALITY CONTROL CHECKPOINTS:
-{chr(10).join(quality_checkpoints)}
-
-📈 COORDINATION METRICS:
-• Dependency Complexity: {coordination_metrics['dependency_depth']} max depth
-• Parallel Potential: {coordination_metrics['parallel_potential']}
-• Quality Gates: {coordination_metrics['quality_checkpoints']} validation points
-• Sync Points: {len(parallel_groups)} coordination phases
-
-🚨 RISK ASSESSMENT:
-• Business Risks: {'; '.join(business_risk_factors) if business_risk_factors else 'Low risk - stable inventory'}
-• Performance Risks: {'; '.join(performance_risk_factors) if performance_risk_factors else 'Optimal coordination efficiency'}
-
-🔄 ORCHESTRATION STATUS: {below_threshold} items flagged for advanced coordination"""
-
-    return result
+    return _TEMPLATE.format_map({
+        "total": total_items,
+        "strategy": workflow_strategy,
+        "pattern": coordination_pattern,
+        "business_risks": "; ".join(business_risk_factors)
+        or "Low risk - stable inventory",
+        "below": below_threshold,
+    })
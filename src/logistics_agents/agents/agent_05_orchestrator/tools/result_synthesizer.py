@@ -2,15 +2,151 @@
 Result Synthesizer Tool - Advanced multi-agent coordination with cross-validation.
 """
 
+import numpy as np
 from agents import RunContextWrapper, function_tool
 
 from ....models.inventory_data import InventoryContext
+from ....utils.helpers import specialize_template
 from ....utils.logging_config import log_tool_interaction
+from .agent_coordinator import workflow_levels
+
+# Cross-agent validation simulation (advanced pattern)
+_VALIDATION_RESULTS = {
+    "quantity_route_alignment": 92,  # Route capacity vs quantity consistency
+    "cost_benefit_optimization": 88,  # Cost savings vs efficiency trade-offs
+    "supplier_capacity_validation": 95,  # Supplier capacity vs order quantities
+    "timeline_feasibility": 85,  # Delivery timelines vs urgency requirements
+    "demand_forecast_accuracy": 90,  # Historical vs predicted demand alignment
+    "consolidation_efficiency": 93,  # Order grouping effectiveness
+}
+
+# Confidence scoring based on weighted validation metrics
+_CONFIDENCE_WEIGHTS = {
+    "quantity_route_alignment": 0.20,
+    "cost_benefit_optimization": 0.18,
+    "supplier_capacity_validation": 0.15,
+    "timeline_feasibility": 0.17,
+    "demand_forecast_accuracy": 0.15,
+    "consolidation_efficiency": 0.15,
+}
+
+_OVERALL_CONFIDENCE = sum(
+    _VALIDATION_RESULTS[metric] * weight
+    for metric, weight in _CONFIDENCE_WEIGHTS.items()
+)
+
+# Advanced performance metrics
+_COORDINATION_EFFECTIVENESS = {
+    "agent_synchronization": 94,  # How well agents coordinated
+    "result_consistency": 89,  # Consistency across agent outputs
+    "optimization_efficiency": 87,  # Overall optimization success
+    "parallel_execution_success": 92,  # Parallel processing effectiveness
+    "quality_gate_success": 96,  # Quality control success rate
+    "cross_validation_accuracy": 91,  # Cross-validation effectiveness
+}
+
+# Performance optimization metrics
+_PERFORMANCE_METRICS = {
+    "execution_time_total": "15.2s",
+    "parallel_efficiency_achieved": "73%",
+    "coordination_overhead": "12%",
+    "quality_validation_time": "2.8s",
+    "optimization_improvement": "34%",
+    "scalability_index": "8.2/10",
+}
+
+_EFFICIENCY_GAINS = 34  # From coordination vs sequential processing
+
+# Sophisticated result integration with conflict resolution
+_INTEGRATION_INSIGHTS = (
+    "✅ Route optimization aligned with quantity recommendations (92% consistency)",
+    "✅ Supplier consolidation validated against capacity constraints (95% feasible)",
+    "⚠️ Timeline conflicts resolved through priority-based scheduling",
+    "✅ Cost-benefit analysis confirmed positive ROI across all recommendations",
+    "✅ Demand forecasts cross-validated with historical patterns (90% accuracy)",
+)
+_INTEGRATION_BLOCK = "\n".join(_INTEGRATION_INSIGHTS)
+
+# Dollar amounts, with the format spec parsed once
+_money = "${:,.2f}".format
+
+
+def _effectiveness_block() -> str:
+    """Coordination effectiveness section."""
+    return f"""📊 COORDINATION EFFECTIVENESS:
+• Agent Synchronization: {_COORDINATION_EFFECTIVENESS['agent_synchronization']}% - {len(_INTEGRATION_INSIGHTS)} integration points validated
+• Result Confidence: {_OVERALL_CONFIDENCE:.1f}% - Cross-validated across {len(_VALIDATION_RESULTS)} metrics
+• Optimization Efficiency: {_COORDINATION_EFFECTIVENESS['optimization_efficiency']}% improvement over single-agent approach
+• Cross-Validation Success: {_COORDINATION_EFFECTIVENESS['cross_validation_accuracy']}% - {len(_INTEGRATION_INSIGHTS)} validation checks passed"""
+
+
+def _insights_block() -> str:
+    """Closing business outcome lines and orchestration insights."""
+    return f"""• Efficiency Gains: {_EFFICIENCY_GAINS}% improvement in processing time vs sequential execution
+• Strategic Alignment: {_COORDINATION_EFFECTIVENESS['optimization_efficiency']}% alignment with business objectives
+
+🔄 ORCHESTRATION INSIGHTS:
+• Agent Coordination: Advanced parallel execution with dependency management
+• Parallel Processing: {len(workflow_levels()[0])} agents executed simultaneously in Group 1
+• Feedback Loops: {len(_VALIDATION_RESULTS)} cross-validation cycles completed successfully
+• Quality Assurance: {_COORDINATION_EFFECTIVENESS['quality_gate_success']}% validation success rate across all checkpoints
+
+🎯 PERFORMANCE METRICS:
+• Orchestration Time: {_PERFORMANCE_METRICS['execution_time_total']} total ({_PERFORMANCE_METRICS['parallel_efficiency_achieved']} parallel efficiency)"""
+
+
+def _validation_block() -> str:
+    """Closing performance lines and validation results."""
+    return f"""• Result Quality: {len(_INTEGRATION_INSIGHTS)} integration validations, {_OVERALL_CONFIDENCE:.1f}% confidence
+• Scalability Index: {_PERFORMANCE_METRICS['scalability_index']} - Excellent coordination scalability
+
+📈 VALIDATION RESULTS:
+• Quantity-Route Alignment: {_VALIDATION_RESULTS['quantity_route_alignment']}% - Routes validated against capacity
+• Cost-Benefit Analysis: {_VALIDATION_RESULTS['cost_benefit_optimization']}% - Optimization trade-offs confirmed
+• Supplier Capacity: {_VALIDATION_RESULTS['supplier_capacity_validation']}% - Capacity constraints validated
+• Timeline Feasibility: {_VALIDATION_RESULTS['timeline_feasibility']}% - Delivery schedules confirmed
+• Demand Accuracy: {_VALIDATION_RESULTS['demand_forecast_accuracy']}% - Forecast validation success
+• Consolidation Efficiency: {_VALIDATION_RESULTS['consolidation_efficiency']}% - Order grouping optimized"""
+
+
+def _integration_block() -> str:
+    """Integration quality section and closing line."""
+    return f"""🔍 INTEGRATION QUALITY:
+{_INTEGRATION_BLOCK}
+
+This advanced orchestration demonstrates the full power of sophisticated "Agents as Tools" patterns with parallel execution, cross-validation, confidence scoring, and performance optimization."""
+
+
+# Report layout. The static sections are filled in once at import, leaving
+# the per-call {fields} for format_map
+_TEMPLATE = specialize_template(
+    """ResultSynthesizer | SUCCESS | 🎯 ADVANCED MULTI-AGENT ORCHESTRATION - Executive Dashboard
+
+$effectiveness
+
+💼 BUSINESS OUTCOMES:
+• Cost Optimization: {savings} ({savings_pct}% reduction)
+• Risk Mitigation: {risk_reduction}% stockout risk reduction through proactive coordination
+$insights
+• Agent Utilization: {suppliers} suppliers coordinated, {below} items optimized
+$validation
+
+🚀 STRATEGIC RECOMMENDATIONS:
+• IMMEDIATE: Execute parallel restocking for {critical} critical items
+• SHORT-TERM: Implement {suppliers}-supplier consolidation strategy
+• MEDIUM-TERM: Deploy advanced coordination patterns for {urgent} urgent items
+• LONG-TERM: Scale parallel orchestration approach across full inventory
+
+$integration""",
+    effectiveness=_effectiveness_block(),
+    insights=_insights_block(),
+    validation=_validation_block(),
+    integration=_integration_block(),
+)
 
 
-@function_tool
 @log_tool_interaction("ResultSynthesizer")
-def create_executive_summary(wrapper: RunContextWrapper[InventoryContext]) -> str:
+def _create_executive_summary(wrapper: RunContextWrapper[InventoryContext]) -> str:
     """
     Advanced result synthesis with cross-agent validation, confidence scoring, and executive dashboard.
 
@@ -23,130 +159,41 @@ def create_executive_summary(wrapper: RunContextWrapper[InventoryContext]) -> st
     context = wrapper.context
 
     total_items = len(context.items)
-    below_threshold = len(context.items_below_threshold)
-
-    # Cross-agent validation simulation (advanced pattern)
-    validation_results = {
-        "quantity_route_alignment": 92,  # Route capacity vs quantity consistency
-        "cost_benefit_optimization": 88,  # Cost savings vs efficiency trade-offs
-        "supplier_capacity_validation": 95,  # Supplier capacity vs order quantities
-        "timeline_feasibility": 85,  # Delivery timelines vs urgency requirements
-        "demand_forecast_accuracy": 90,  # Historical vs predicted demand alignment
-        "consolidation_efficiency": 93,  # Order grouping effectiveness
-    }
-
-    # Confidence scoring based on weighted validation metrics
-    confidence_weights = {
-        "quantity_route_alignment": 0.20,
-        "cost_benefit_optimization": 0.18,
-        "supplier_capacity_validation": 0.15,
-        "timeline_feasibility": 0.17,
-        "demand_forecast_accuracy": 0.15,
-        "consolidation_efficiency": 0.15,
-    }
-
-    overall_confidence = sum(
-        validation_results[metric] * weight
-        for metric, weight in confidence_weights.items()
-    )
 
-    # Advanced performance metrics
-    coordination_effectiveness = {
-        "agent_synchronization": 94,  # How well agents coordinated
-        "result_consistency": 89,  # Consistency across agent outputs
-        "optimization_efficiency": 87,  # Overall optimization success
-        "parallel_execution_success": 92,  # Parallel processing effectiveness
-        "quality_gate_success": 96,  # Quality control success rate
-        "cross_validation_accuracy": 91,  # Cross-validation effectiveness
-    }
-
-    # Performance optimization metrics
-    performance_metrics = {
-        "execution_time_total": "15.2s",
-        "parallel_efficiency_achieved": "73%",
-        "coordination_overhead": "12%",
-        "quality_validation_time": "2.8s",
-        "optimization_improvement": "34%",
-        "scalability_index": "8.2/10",
-    }
+    # Item-level figures come from the context's cached column arrays
+    stock = context.stock_arr
+    threshold = context.threshold_arr
+    below_mask = context.below_threshold_mask
+    below_threshold = int(np.count_nonzero(below_mask))
 
     # Business outcome calculations
-    estimated_restock_cost = sum(
-        item.unit_cost * item.order_quantity for item in context.items_below_threshold
+    estimated_restock_cost = float(
+        np.dot(context.unit_cost_arr[below_mask], context.qty_arr[below_mask])
     )
 
     projected_savings = (
         estimated_restock_cost * 0.15
     )  # 15% savings through optimization
     risk_reduction = min(85, (total_items - below_threshold) / total_items * 100)
-    efficiency_gains = 34  # From coordination vs sequential processing
-
-    # Sophisticated result integration with conflict resolution
-    integration_insights = [
-        "✅ Route optimization aligned with quantity recommendations (92% consistency)",
-        "✅ Supplier consolidation validated against capacity constraints (95% feasible)",
-        "⚠️ Timeline conflicts resolved through priority-based scheduling",
-        "✅ Cost-benefit analysis confirmed positive ROI across all recommendations",
-        "✅ Demand forecasts cross-validated with historical patterns (90% accuracy)",
-    ]
 
     # Executive dashboard format
-    critical_count = sum(
-        1
-        for item in context.items
-        if item.current_stock <= item.reorder_threshold * 0.5
-    )
-    urgent_count = sum(
-        1
-        for item in context.items
-        if item.current_stock <= item.reorder_threshold * 0.8
-    )
-
-    suppliers_involved = min(4, len(context.items_below_threshold) // 5 + 1)
-
-    result = f"""ResultSynthesizer | SUCCESS | 🎯 ADVANCED MULTI-AGENT ORCHESTRATION - Executive Dashboard
-
-📊 COORDINATION EFFECTIVENESS:
-• Agent Synchronization: {coordination_effectiveness['agent_synchronization']}% - {len(integration_insights)} integration points validated
-• Result Confidence: {overall_confidence:.1f}% - Cross-validated across {len(validation_results)} metrics
-• Optimization Efficiency: {coordination_effectiveness['optimization_efficiency']}% improvement over single-agent approach
-• Cross-Validation Success: {coordination_effectiveness['cross_validation_accuracy']}% - {len(integration_insights)} validation checks passed
-
-💼 BUSINESS OUTCOMES:
-• Cost Optimization: ${projected_savings:,.2f} ({projected_savings/estimated_restock_cost*100:.1f}% reduction)
-• Risk Mitigation: {risk_reduction:.1f}% stockout risk reduction through proactive coordination
-• Efficiency Gains: {efficiency_gains}% improvement in processing time vs sequential execution
-• Strategic Alignment: {coordination_effectiveness['optimization_efficiency']}% alignment with business objectives
-
-🔄 ORCHESTRATION INSIGHTS:
-• Agent Coordination: Advanced parallel execution with dependency management
-• Parallel Processing: {len(['threshold_monitor', 'supplier_matcher', 'demand_forecaster'])} agents executed simultaneously in Group 1
-• Feedback Loops: {len(validation_results)} cross-validation cycles completed successfully
-• Quality Assurance: {coordination_effectiveness['quality_gate_success']}% validation success rate across all checkpoints
-
-🎯 PERFORMANCE METRICS:
-• Orchestration Time: {performance_metrics['execution_time_total']} total ({performance_metrics['parallel_efficiency_achieved']} parallel efficiency)
-• Agent Utilization: {suppliers_involved} suppliers coordinated, {below_threshold} items optimized
-• Result Quality: {len(integration_insights)} integration validations, {overall_confidence:.1f}% confidence
-• Scalability Index: {performance_metrics['scalability_index']} - Excellent coordination scalability
-
-📈 VALIDATION RESULTS:
-• Quantity-Route Alignment: {validation_results['quantity_route_alignment']}% - Routes validated against capacity
-• Cost-Benefit Analysis: {validation_results['cost_benefit_optimization']}% - Optimization trade-offs confirmed
-• Supplier Capacity: {validation_results['supplier_capacity_validation']}% - Capacity constraints validated
-• Timeline Feasibility: {validation_results['timeline_feasibility']}% - Delivery schedules confirmed
-• Demand Accuracy: {validation_results['demand_forecast_accuracy']}% - Forecast validation success
-• Consolidation Efficiency: {validation_results['consolidation_efficiency']}% - Order grouping optimized
-
-🚀 STRATEGIC RECOMMENDATIONS:
-• IMMEDIATE: Execute parallel restocking for {critical_count} critical items
-• SHORT-TERM: Implement {suppliers_involved}-supplier consolidation strategy
-• MEDIUM-TERM: Deploy advanced coordination patterns for {urgent_count} urgent items
-• LONG-TERM: Scale parallel orchestration approach across full inventory
-
-🔍 INTEGRATION QUALITY:
-{chr(10).join(integration_insights)}
-
-This advanced orchestration demonstrates the full power of sophisticated "Agents as Tools" patterns with parallel execution, cross-validation, confidence scoring, and performance optimization."""
-
-    return result
+    critical_count = int(np.count_nonzero(context.critical_mask))
+    urgent_count = int(np.count_nonzero(stock <= threshold * 0.8))
+
+    suppliers_involved = min(4, below_threshold // 5 + 1)
+
+    # Only the item-dependent lines are formatted per call
+    return _TEMPLATE.format_map({
+        "savings": _money(projected_savings),
+        "savings_pct": f"{projected_savings / estimated_restock_cost * 100:.1f}",
+        "risk_reduction": f"{risk_reduction:.1f}",
+        "suppliers": suppliers_involved,
+        "below": below_threshold,
+        "critical": critical_count,
+        "urgent": urgent_count,
+    })
+
+
+create_executive_summary = function_tool(
+    _create_executive_summary, name_override="create_executive_summary"
+)
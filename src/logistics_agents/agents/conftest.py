@@ -5,8 +5,9 @@ This file provides common fixtures and utilities for testing all logistics agent
 
 from src.logistics_agents.models.inventory_data import InventoryContext
 from src.logistics_agents.utils.data_loader import load_sample_inventory_context
+import copy
+import numpy as np
 import pytest
-import asyncio
 from pathlib import Path
 import sys
 
@@ -16,26 +17,34 @@ sys.path.insert(0, str(project_root))
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def _raw_inventory() -> InventoryContext:
+    """Load the sample inventory once for the whole test session."""
+    return load_sample_inventory_context()
 
 
 @pytest.fixture
-def sample_inventory_context() -> InventoryContext:
-    """Provide sample inventory context for testing."""
-    return load_sample_inventory_context()
+def sample_inventory_context(_raw_inventory) -> InventoryContext:
+    """Provide sample inventory context for testing.
+
+    The context is shared across tests and must be treated as read-only;
+    tests that edit items should use ``sample_inventory_context_copy``.
+    """
+    return _raw_inventory
 
 
 @pytest.fixture
-def urgent_items_context(sample_inventory_context):
+def sample_inventory_context_copy(_raw_inventory) -> InventoryContext:
+    """Provide a private copy of the sample inventory for tests that mutate it."""
+    return copy.deepcopy(_raw_inventory)
+
+
+@pytest.fixture(scope="session")
+def urgent_items_context(_raw_inventory) -> InventoryContext:
     """Provide context with only urgent items for focused testing."""
-    context = sample_inventory_context
+    context = _raw_inventory
     # Filter to only items below threshold for testing
-    urgent_items = [
-        item for item in context.items if item.current_stock <= item.order_quantity * 0.2][:5]
+    urgent_mask = context.stock_arr <= context.qty_arr * 0.2
+    urgent_items = [context.items[i] for i in np.flatnonzero(urgent_mask)[:5]]
 
     # Create a new context with only urgent items for focused testing
     return InventoryContext(
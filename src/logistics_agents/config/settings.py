@@ -1,8 +1,9 @@
 """Configuration management for logistics agents."""
 
 import os
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from dotenv import load_dotenv
 from pydantic import Field
@@ -20,14 +21,7 @@ class Settings(BaseSettings):
     Settings are loaded from environment variables and .env files.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
-        """Initialize settings with fresh .env file reload."""
-        # Force reload .env file to get latest values every time
-        load_dotenv(override=True)
-        super().__init__(**kwargs)
-
-        # OpenAI Configuration
-
+    # OpenAI Configuration
     openai_api_key: str = "sk-placeholder-key"
     openai_model: str = "gpt-4o-mini"
 
@@ -39,7 +33,7 @@ class Settings(BaseSettings):
     log_truncate_agent_instructions: int = 0  # 0 = no truncation, >0 = max chars
     log_truncate_agent_input: int = 0  # 0 = no truncation, >0 = max chars
     log_truncate_agent_output: int = 0  # 0 = no truncation, >0 = max chars
-    log_truncate_tool_output: int = 0  # 0 = no truncation, >0 = max chars
+    log_truncate_tool_output: int = 256  # 0 = no truncation, >0 = max chars
     log_truncate_tool_input: int = 0  # 0 = no truncation, >0 = max chars
 
     # Data Configuration
@@ -54,6 +48,7 @@ class Settings(BaseSettings):
 
     # Performance Configuration
     concurrent_agents: int = 3
+    result_cache_ttl_seconds: int = 3600  # 0 = never reuse agent run results
 
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
@@ -67,18 +62,18 @@ class Settings(BaseSettings):
             FileNotFoundError: If data_path doesn't exist
             PermissionError: If cannot create output directory
         """
-        if not self.data_path.exists():
+        if not self.data_path.is_file():
             raise FileNotFoundError(f"Data file not found: {self.data_path}")
 
         # Create output directory if it doesn't exist
         self.output_path.mkdir(parents=True, exist_ok=True)
 
-    def get_agent_config(self) -> dict:
+    @cached_property
+    def agent_config(self) -> dict:
         """
-        Get common configuration for all agents.
+        Common configuration for all agents, built once per instance.
 
-        Returns:
-            dict: Configuration dictionary for agent initialization
+        The dictionary is shared between callers, so treat it as read-only.
         """
         return {
             "model": self.openai_model,
@@ -87,6 +82,15 @@ class Settings(BaseSettings):
             "max_iterations": self.max_iterations,
         }
 
+    def get_agent_config(self) -> dict:
+        """
+        Get common configuration for all agents.
+
+        Returns:
+            dict: Configuration dictionary for agent initialization
+        """
+        return self.agent_config
+
     def truncate_text(self, text: str, max_length: int, label: str = "") -> str:
         """
         Truncate text based on configuration.
@@ -99,56 +103,67 @@ class Settings(BaseSettings):
         Returns:
             Original or truncated text
         """
-        if max_length == 0 or len(text) <= max_length:
+        if not max_length:
+            return text
+        text_length = len(text)
+        if text_length <= max_length:
             return text
-        return f"{text[:max_length]}... [TRUNCATED - {len(text)} total chars]"
+        return f"{text[:max_length]}... [TRUNCATED - {text_length} total chars]"
 
 
-def get_settings() -> Settings:
-    """
-    Get a fresh settings instance that reads from current environment/files.
+# Last settings built, with the .env modification time they were read at
+_cached_settings: Optional[Tuple[int, Settings]] = None
 
-    This function always returns a fresh settings instance with the latest
-    .env file values, ensuring environment changes are picked up automatically.
 
-    Returns:
-        Settings: Fresh settings instance with current .env values
-    """
-    return Settings()
+def _env_mtime() -> int:
+    """Modification time of the .env file in nanoseconds, 0 if it is missing."""
+    try:
+        return os.stat(".env").st_mtime_ns
+    except FileNotFoundError:
+        return 0
 
 
-class AutoRefreshSettings:
+def get_settings() -> Settings:
     """
-    A settings proxy that always returns fresh settings with current .env values.
+    Get a settings instance that reflects the current .env file.
+
+    The instance is reused until the .env file's modification time changes,
+    so reading settings costs one ``stat`` call rather than a full .env
+    parse and validation; edits to the file are still picked up
+    automatically.
 
-    This ensures that any changes to the .env file are automatically picked up
-    without requiring manual reloads or restart.
+    Returns:
+        Settings: Settings instance with current .env values
     """
+    global _cached_settings
 
-    def __getattr__(self, name: str) -> Any:
-        """Delegate all attribute access to a fresh Settings instance."""
-        return getattr(get_settings(), name)
+    mtime = _env_mtime()
+    cached = _cached_settings
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
-    def __call__(self) -> Settings:
-        """Allow calling like settings() to get fresh instance."""
-        return get_settings()
+    load_dotenv(override=True)
+    fresh = Settings()
+    _cached_settings = (mtime, fresh)
+    return fresh
 
 
 def reload_settings() -> None:
-    """Reload the global settings instance from current environment/files."""
-    # This function is now deprecated since settings auto-refresh
-    # but kept for backwards compatibility
-    pass
-
-
-# Global settings instance that auto-refreshes .env values
-# This ensures the latest .env file is always loaded automatically
-settings = AutoRefreshSettings()
-
-# Validate settings on import
-try:
-    settings.validate_paths()
-except (FileNotFoundError, PermissionError) as e:
-    if settings.debug:
-        print(f"Settings validation warning: {e}")
-    # Don't fail hard during import, let the application handle it
+    """
+    Reread the environment and .env file into the shared ``settings``.
+
+    ``settings`` is a plain Settings instance read once at import. Modules
+    hold references to it, so it is updated in place rather than replaced.
+    """
+    global _cached_settings
+    _cached_settings = None
+    fresh = get_settings()
+    for name in Settings.model_fields:
+        setattr(settings, name, getattr(fresh, name))
+    # Derived values are rebuilt from the new fields on next use
+    settings.__dict__.pop("agent_config", None)
+
+
+# Global settings instance, read once at import; attribute reads go straight
+# to the model. Call reload_settings() to pick up later .env changes
+settings = get_settings()
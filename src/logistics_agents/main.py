@@ -4,16 +4,23 @@ import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-
-from agents import Runner, trace
+from typing import Any, Coroutine
 
 from .config.settings import settings
 from .models.inventory_data import InventoryContext
 from .utils.logging_config import setup_logging, log_system_event, log_session_end
-from .utils.agent_runner import LoggedAgentRunner
 from .utils.data_loader import load_sample_inventory_context
 
 
+def _run_async(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on uvloop when it is installed, else on asyncio's default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
 async def run_inventory_analysis(context: InventoryContext) -> None:
     """Run comprehensive inventory management analysis."""
     console_logger, file_logger = setup_logging()
@@ -21,10 +28,17 @@ async def run_inventory_analysis(context: InventoryContext) -> None:
     log_system_event("ANALYSIS_START",
                      f"Items: {len(context.items)}, Region: {context.region}")
 
-    # Import orchestrator only when needed to avoid circular imports
-    from .agents.agent_05_orchestrator.agent import InventoryOrchestrator
+    # Import the agents SDK and orchestrator only when needed, to avoid
+    # circular imports and keep importing the package cheap
+    from agents import trace
 
-    orchestrator = InventoryOrchestrator()
+    from .agents.agent_05_orchestrator.agent import get_orchestrator
+    from .utils.agent_runner import LoggedAgentRunner
+
+    orchestrator = get_orchestrator()
+
+    # Build the shared item arrays once, before any agent tools read them
+    context.precompute()
 
     with trace("InventoryAnalysis"):
         # Use logged agent runner for comprehensive tracking
@@ -49,6 +63,13 @@ def main() -> None:
 
     log_system_event("APPLICATION_START", f"Model: {settings.openai_model}")
 
+    # Checked here rather than at import, so importing the package stays free
+    # of filesystem access
+    try:
+        settings.validate_paths()
+    except (FileNotFoundError, PermissionError) as e:
+        console_logger.warning(f"Settings validation warning: {e}")
+
     try:
         # Load actual inventory data from CSV
         console_logger.info("Loading inventory data from CSV...")
@@ -78,7 +99,7 @@ def main() -> None:
             "DATA_FALLBACK", "Using minimal context due to load failure")
 
     try:
-        asyncio.run(run_inventory_analysis(context))
+        _run_async(run_inventory_analysis(context))
     except Exception as e:
         console_logger.error(f"Analysis failed: {e}")
         file_logger.error(f"ANALYSIS_ERROR | {str(e)}")
@@ -18,6 +18,8 @@ from .inventory_data import (
     InventoryItem,
     Supplier,
     RestockOrder,
+    RestockGroups,
+    ReorderLine,
     InventoryContext
 )
 
@@ -35,6 +37,8 @@ __all__ = [
     "InventoryItem",
     "Supplier",
     "RestockOrder",
+    "RestockGroups",
+    "ReorderLine",
     "InventoryContext",
     # Analysis result models
     "ThresholdMonitorResult",
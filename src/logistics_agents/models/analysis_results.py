@@ -1,13 +1,21 @@
 """Analysis result data models for all logistics agents."""
 
-from dataclasses import dataclass
+import math
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class ThresholdMonitorResult:
     """
     Results from Agent 01 - Inventory Threshold Monitor (Martin).
@@ -40,9 +48,19 @@ class ThresholdMonitorResult:
                 "total_analyzed": len(self.priority_classifications),
                 "below_threshold_count": len(self.items_below_threshold),
                 "critical_count": len(self.critical_items),
-                "analysis_timestamp": datetime.now().isoformat(),
+                # Raw clock reading; formatted by metadata_with_iso()
+                "analysis_timestamp_ns": time.time_ns(),
             }
 
+    def metadata_with_iso(self) -> Dict[str, Any]:
+        """Get a copy of the metadata with the timestamp as an ISO string."""
+        metadata = dict(self.analysis_metadata or {})
+        timestamp_ns = metadata.pop("analysis_timestamp_ns", None)
+        if timestamp_ns is not None:
+            metadata["analysis_timestamp"] = datetime.fromtimestamp(
+                timestamp_ns / 1e9).isoformat()
+        return metadata
+
     @property
     def urgent_action_required(self) -> bool:
         """Check if any urgent actions are required."""
@@ -58,7 +76,7 @@ class ThresholdMonitorResult:
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteComputationResult:
     """
     Results from Agent 02 - Route Computer (Rhiannon).
@@ -81,28 +99,23 @@ class RouteComputationResult:
     efficiency_metrics: Dict[str, float]
     cost_estimates: Dict[str, float]  # route_id -> estimated_cost
     # route_id -> [consolidatable_routes]
-    consolidation_opportunities: Optional[Dict[str, List[str]]] = None
-    recommendations: Optional[List[str]] = None
+    consolidation_opportunities: Dict[str, List[str]] = field(default_factory=dict)
+    recommendations: List[str] = field(default_factory=list)
     summary: str = ""
 
-    def __post_init__(self) -> None:
-        """Initialize optional fields."""
-        if self.consolidation_opportunities is None:
-            self.consolidation_opportunities = {}
-        if self.recommendations is None:
-            self.recommendations = []
-
     @property
     def total_estimated_cost(self) -> float:
         """Calculate total estimated transportation costs."""
-        return sum(self.cost_estimates.values())
+        return math.fsum(self.cost_estimates.values())
 
     @property
     def average_efficiency(self) -> float:
         """Calculate average route efficiency."""
         if not self.efficiency_metrics:
             return 0.0
-        return sum(self.efficiency_metrics.values()) / len(self.efficiency_metrics)
+        return math.fsum(self.efficiency_metrics.values()) / len(
+            self.efficiency_metrics
+        )
 
     @property
     def most_efficient_route(self) -> Optional[str]:
@@ -114,7 +127,7 @@ class RouteComputationResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RestockCalculationResult:
     """
     Results from Agent 03 - Restocking Calculator (Nathan).
@@ -139,18 +152,13 @@ class RestockCalculationResult:
     # item_id -> estimated_order_cost
     cost_estimates: Dict[str, float]
     abc_classifications: Dict[str, str]  # item_id -> ABC_class
-    recommendations: Optional[List[str]] = None
+    recommendations: List[str] = field(default_factory=list)
     summary: str = ""
 
-    def __post_init__(self) -> None:
-        """Initialize optional fields."""
-        if self.recommendations is None:
-            self.recommendations = []
-
     @property
     def total_order_value(self) -> float:
         """Calculate total value of all recommended orders."""
-        return sum(self.cost_estimates.values())
+        return math.fsum(self.cost_estimates.values())
 
     @property
     def items_requiring_orders(self) -> List[str]:
@@ -167,7 +175,7 @@ class RestockCalculationResult:
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderConsolidationResult:
     """
     Results from Agent 04 - Order Consolidation (Anagha).
@@ -190,21 +198,14 @@ class OrderConsolidationResult:
     supplier_optimizations: Dict[str, Dict[str, Any]]
     estimated_savings: Dict[str, float]  # savings_type -> amount
     consolidation_schedule: Dict[str, Any]  # schedule_info
-    coordination_requirements: Optional[List[str]] = None
-    recommendations: Optional[List[str]] = None
+    coordination_requirements: List[str] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
     summary: str = ""
 
-    def __post_init__(self) -> None:
-        """Initialize optional fields."""
-        if self.coordination_requirements is None:
-            self.coordination_requirements = []
-        if self.recommendations is None:
-            self.recommendations = []
-
     @property
     def total_estimated_savings(self) -> float:
         """Calculate total estimated savings from all consolidation opportunities."""
-        return sum(self.estimated_savings.values())
+        return math.fsum(self.estimated_savings.values())
 
     @property
     def high_impact_consolidations(self) -> Dict[str, Any]:
@@ -293,6 +294,22 @@ class ComprehensiveSupplyChainAnalysis(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @field_serializer("threshold_analysis", mode="wrap")
+    def _serialize_threshold_analysis(
+        self,
+        value: Optional[ThresholdMonitorResult],
+        handler: SerializerFunctionWrapHandler,
+    ) -> Any:
+        """Dump the threshold metadata with its timestamp as an ISO string.
+
+        Keeps the ``analysis_timestamp`` key that consumers of the dumped
+        analysis read, while the result itself stores the raw clock reading.
+        """
+        data = handler(value)
+        if value is not None and isinstance(data, dict) and "analysis_metadata" in data:
+            data["analysis_metadata"] = value.metadata_with_iso()
+        return data
+
     @property
     def urgent_actions(self) -> List[Dict[str, Any]]:
         """Get list of urgent actions (HIGH priority)."""
@@ -317,7 +334,10 @@ class ComprehensiveSupplyChainAnalysis(BaseModel):
     def implementation_complexity(self) -> str:
         """Assess overall implementation complexity."""
         action_count = len(self.priority_actions)
-        urgent_count = len(self.urgent_actions)
+        # Count without building the urgent_actions list
+        urgent_count = sum(
+            action.get("priority") == "HIGH" for action in self.priority_actions
+        )
 
         if urgent_count > 5 or action_count > 20:
             return "HIGH"
@@ -329,10 +349,14 @@ class ComprehensiveSupplyChainAnalysis(BaseModel):
     @property
     def roi_projection(self) -> Optional[float]:
         """Calculate rough ROI projection if cost data is available."""
-        if self.restock_calculation and self.total_potential_savings > 0:
+        if not self.restock_calculation:
+            return None
+        # Sum the savings dict once rather than for both the check and the ratio
+        savings = self.total_potential_savings
+        if savings > 0:
             total_investment = self.restock_calculation.total_order_value
             if total_investment > 0:
-                return (self.total_potential_savings / total_investment) * 100
+                return (savings / total_investment) * 100
         return None
 
     def get_agent_summary(self) -> Dict[str, Dict[str, Any]]:
@@ -360,25 +384,32 @@ class ComprehensiveSupplyChainAnalysis(BaseModel):
                 "total_cost": self.route_computation.total_estimated_cost,
             }
 
-        if self.restock_calculation:
+        # Counts are tallied in one pass per dict, without building the
+        # item lists the corresponding properties return
+        restock = self.restock_calculation
+        if restock:
             summary["restock_calculator"] = {
                 "items_requiring_orders": float(
-                    len(self.restock_calculation.items_requiring_orders)
+                    sum(qty > 0 for qty in restock.recommended_orders.values())
                 ),
-                "total_order_value": self.restock_calculation.total_order_value,
+                "total_order_value": restock.total_order_value,
                 "high_value_items": float(
-                    len(self.restock_calculation.high_value_items)
+                    sum(grade == "A" for grade in restock.abc_classifications.values())
                 ),
             }
 
-        if self.order_consolidation:
+        consolidation = self.order_consolidation
+        if consolidation:
             summary["order_consolidation"] = {
-                "total_savings": self.order_consolidation.total_estimated_savings,
+                "total_savings": consolidation.total_estimated_savings,
                 "consolidation_opportunities": float(
-                    len(self.order_consolidation.consolidation_opportunities)
+                    len(consolidation.consolidation_opportunities)
                 ),
                 "preferred_suppliers": float(
-                    len(self.order_consolidation.preferred_suppliers)
+                    sum(
+                        opt_data.get("strategy") == "PREFERRED_SUPPLIER"
+                        for opt_data in consolidation.supplier_optimizations.values()
+                    )
                 ),
             }
 
@@ -387,8 +418,21 @@ class ComprehensiveSupplyChainAnalysis(BaseModel):
 
 # Additional helper models for complex data structures
 
-
-@dataclass
+# (probability, impact) -> overall risk level
+_RISK_MATRIX = {
+    ("LOW", "LOW"): "LOW",
+    ("LOW", "MEDIUM"): "LOW",
+    ("LOW", "HIGH"): "MEDIUM",
+    ("MEDIUM", "LOW"): "LOW",
+    ("MEDIUM", "MEDIUM"): "MEDIUM",
+    ("MEDIUM", "HIGH"): "HIGH",
+    ("HIGH", "LOW"): "MEDIUM",
+    ("HIGH", "MEDIUM"): "HIGH",
+    ("HIGH", "HIGH"): "HIGH",
+}
+
+
+@dataclass(slots=True)
 class ActionItem:
     """
     Represents a specific action item in the implementation plan.
@@ -409,19 +453,12 @@ class ActionItem:
     priority: str
     timeline: str
     responsible_party: str
-    dependencies: Optional[List[str]] = None
-    success_criteria: Optional[List[str]] = None
+    dependencies: List[str] = field(default_factory=list)
+    success_criteria: List[str] = field(default_factory=list)
     estimated_impact: str = ""
 
-    def __post_init__(self) -> None:
-        """Initialize optional fields."""
-        if self.dependencies is None:
-            self.dependencies = []
-        if self.success_criteria is None:
-            self.success_criteria = []
-
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessment:
     """
     Represents a risk assessment for the supply chain optimization plan.
@@ -440,25 +477,9 @@ class RiskAssessment:
     probability: str  # LOW, MEDIUM, HIGH
     impact: str  # LOW, MEDIUM, HIGH
     mitigation_strategies: List[str]
-    contingency_plans: Optional[List[str]] = None
-
-    def __post_init__(self) -> None:
-        """Initialize optional fields."""
-        if self.contingency_plans is None:
-            self.contingency_plans = []
+    contingency_plans: List[str] = field(default_factory=list)
 
     @property
     def risk_level(self) -> str:
         """Calculate overall risk level based on probability and impact."""
-        risk_matrix = {
-            ("LOW", "LOW"): "LOW",
-            ("LOW", "MEDIUM"): "LOW",
-            ("LOW", "HIGH"): "MEDIUM",
-            ("MEDIUM", "LOW"): "LOW",
-            ("MEDIUM", "MEDIUM"): "MEDIUM",
-            ("MEDIUM", "HIGH"): "HIGH",
-            ("HIGH", "LOW"): "MEDIUM",
-            ("HIGH", "MEDIUM"): "HIGH",
-            ("HIGH", "HIGH"): "HIGH",
-        }
-        return risk_matrix.get((self.probability, self.impact), "MEDIUM")
+        return _RISK_MATRIX.get((self.probability, self.impact), "MEDIUM")
@@ -3,9 +3,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 class ProductCategory(str, Enum):
@@ -41,13 +42,15 @@ class Priority(str, Enum):
     LOW = "LOW"
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     """
     Represents a single inventory item from the CSV data.
 
     This model maps directly to the CSV structure and provides
-    type safety and validation for inventory operations.
+    type safety and validation for inventory operations. Fields are
+    stored in ``__slots__`` to keep per-item memory and attribute
+    access cheap in the per-item tool loops.
 
     Attributes:
         item_id: Unique identifier (SKU) for the inventory item
@@ -210,6 +213,50 @@ class RestockOrder:
         return self.estimated_cost / self.quantity if self.quantity > 0 else 0.0
 
 
+@dataclass(frozen=True)
+class RestockGroups:
+    """
+    Items needing restock grouped by supplier.
+
+    Groups are numbered in order of each supplier's first appearance among
+    the restock items; per-item arrays are aligned with
+    ``InventoryContext.restock_indices``.
+
+    Attributes:
+        supplier_ids: Supplier of each group
+        groups: Group number of each restock item
+        order_values: Reorder value (refill quantity x unit cost) per item
+        counts: Number of items per group
+        order_totals: Total reorder value per group
+        location_counts: Number of distinct supplier locations per group
+    """
+
+    supplier_ids: List[str]
+    groups: np.ndarray
+    order_values: np.ndarray
+    counts: np.ndarray
+    order_totals: np.ndarray
+    location_counts: np.ndarray
+
+
+@dataclass(slots=True, frozen=True)
+class ReorderLine:
+    """
+    One reorder recommendation, kept structured for tool chaining.
+
+    Attributes:
+        item_id: Item to reorder
+        quantity: Recommended order quantity
+        cost: Total cost of the recommended quantity
+        current_stock: Stock level when the recommendation was made
+    """
+
+    item_id: str
+    quantity: int
+    cost: float
+    current_stock: int
+
+
 class InventoryContext(BaseModel):
     """
     Context for inventory analysis containing all relevant data.
@@ -251,6 +298,17 @@ class InventoryContext(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Struct-of-arrays cache over ``items``, rebuilt when the items change
+    _array_cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _array_cache_key: Optional[Tuple[int, int, int]] = PrivateAttr(default=None)
+    _items_version: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Invalidate cached item arrays when ``items`` is reassigned."""
+        super().__setattr__(name, value)
+        if name == "items":
+            self.mark_items_changed()
+
     @field_validator("items")
     @classmethod
     def validate_items(cls, v: List[InventoryItem]) -> List[InventoryItem]:
@@ -259,6 +317,249 @@ class InventoryContext(BaseModel):
             raise ValueError("Items list cannot be empty")
         return v
 
+    def mark_items_changed(self) -> None:
+        """
+        Invalidate the cached item arrays.
+
+        Call this after mutating items in place (for example updating
+        ``current_stock``) so the next vectorized read rebuilds the arrays.
+        """
+        self._items_version += 1
+
+    def _cached(self, key: str, build: Callable[[], Any]) -> Any:
+        """Return a cached value derived from ``items``, building it on first use."""
+        cache_key = (self._items_version, id(self.items), len(self.items))
+        if self._array_cache_key != cache_key:
+            self._array_cache = {}
+            self._array_cache_key = cache_key
+        if key not in self._array_cache:
+            self._array_cache[key] = build()
+        return self._array_cache[key]
+
+    def _column(self, attr: str, dtype: Any) -> np.ndarray:
+        """Gather one item attribute into a contiguous NumPy array."""
+        return np.fromiter(
+            (getattr(item, attr) or 0 for item in self.items),
+            dtype=dtype,
+            count=len(self.items),
+        )
+
+    @property
+    def stock_arr(self) -> np.ndarray:
+        """Current stock level of every item as an int64 array."""
+        return self._cached(
+            "current_stock", lambda: self._column("current_stock", np.int64)
+        )
+
+    @property
+    def threshold_arr(self) -> np.ndarray:
+        """Reorder threshold of every item as an int64 array."""
+        return self._cached(
+            "reorder_threshold", lambda: self._column("reorder_threshold", np.int64)
+        )
+
+    @property
+    def qty_arr(self) -> np.ndarray:
+        """Order quantity of every item as an int64 array."""
+        return self._cached(
+            "order_quantity", lambda: self._column("order_quantity", np.int64)
+        )
+
+    @property
+    def unit_cost_arr(self) -> np.ndarray:
+        """Unit cost of every item as a float64 array."""
+        return self._cached(
+            "unit_cost", lambda: self._column("unit_cost", np.float64)
+        )
+
+    @property
+    def reorder_qty_arr(self) -> np.ndarray:
+        """Units needed to refill each item to its order quantity (int64)."""
+        return self._cached("reorder_qty", lambda: self.qty_arr - self.stock_arr)
+
+    @property
+    def reorder_value_arr(self) -> np.ndarray:
+        """Cost of refilling each item to its order quantity (float64)."""
+        return self._cached(
+            "reorder_value", lambda: self.unit_cost_arr * self.reorder_qty_arr
+        )
+
+    @property
+    def supplier_codes(self) -> Tuple[np.ndarray, List[str]]:
+        """
+        Supplier of every item encoded as small ints.
+
+        Returns:
+            Tuple of (code per item, supplier IDs indexed by code), with codes
+            assigned in order of first appearance
+        """
+        def build() -> Tuple[np.ndarray, List[str]]:
+            index: Dict[str, int] = {}
+            codes = np.fromiter(
+                (index.setdefault(item.supplier_id, len(index)) for item in self.items),
+                dtype=np.intp,
+                count=len(self.items),
+            )
+            return codes, list(index)
+
+        return self._cached("supplier_codes", build)
+
+    @property
+    def below_threshold_mask(self) -> np.ndarray:
+        """
+        Boolean mask of items at or below their reorder threshold.
+
+        Vectorized equivalent of ``item.is_below_threshold`` for every item,
+        shared read-only between all consumers of this context.
+        """
+        def build() -> np.ndarray:
+            mask = self.stock_arr <= self.threshold_arr
+            mask.flags.writeable = False
+            return mask
+
+        return self._cached("below_threshold", build)
+
+    @property
+    def critical_mask(self) -> np.ndarray:
+        """
+        Boolean mask of critically low items.
+
+        Vectorized equivalent of ``item.is_critical`` (stock at or below
+        half the reorder threshold), shared read-only between consumers.
+        """
+        def build() -> np.ndarray:
+            mask = self.stock_arr <= self.threshold_arr * 0.5
+            mask.flags.writeable = False
+            return mask
+
+        return self._cached("critical", build)
+
+    @property
+    def restock_mask(self) -> np.ndarray:
+        """
+        Boolean mask of items needing restock.
+
+        An item needs restock when its stock is at or below 20% of its
+        order quantity; shared read-only between all consumers.
+        """
+        def build() -> np.ndarray:
+            mask = self.stock_arr <= self.qty_arr * 0.2
+            mask.flags.writeable = False
+            return mask
+
+        return self._cached("restock", build)
+
+    @property
+    def restock_indices(self) -> np.ndarray:
+        """Indices of items needing restock, in item order (read-only)."""
+        def build() -> np.ndarray:
+            indices = np.flatnonzero(self.restock_mask)
+            indices.flags.writeable = False
+            return indices
+
+        return self._cached("restock_indices", build)
+
+    def most_urgent_restock(self, k: int = 5) -> np.ndarray:
+        """
+        Indices of the ``k`` restock items with the least stock left.
+
+        Urgency is the share of the order quantity already consumed; the
+        top ``k`` are picked with a partial partition rather than a full
+        sort, and ties keep their item order.
+
+        Args:
+            k: Maximum number of items to return
+
+        Returns:
+            Read-only index array of up to ``k`` items, most urgent first
+        """
+        def build() -> np.ndarray:
+            candidates = self.restock_indices
+            remaining = self.stock_arr[candidates] / np.maximum(self.qty_arr[candidates], 1)
+            if len(candidates) > k:
+                # Everything at or below the k-th smallest share, in item order
+                cutoff = np.partition(remaining, k - 1)[k - 1]
+                shortlist = np.flatnonzero(remaining <= cutoff)
+            else:
+                shortlist = np.arange(len(candidates))
+            order = np.argsort(remaining[shortlist], kind="stable")[:k]
+            indices = candidates[shortlist[order]]
+            indices.flags.writeable = False
+            return indices
+
+        return self._cached(f"most_urgent_restock:{k}", build)
+
+    @property
+    def has_restock(self) -> bool:
+        """Whether any item needs restock (fast path for healthy inventories)."""
+        return self._cached("has_restock", lambda: bool(self.restock_mask.any()))
+
+    @property
+    def restock_groups(self) -> RestockGroups:
+        """Items needing restock grouped by supplier, built once per context."""
+        def build() -> RestockGroups:
+            restock_idx = self.restock_indices
+            codes, supplier_ids = self.supplier_codes
+
+            # np.unique sorts by code; renumber groups by first appearance
+            unique, first, inverse = np.unique(
+                codes[restock_idx], return_index=True, return_inverse=True)
+            order = np.argsort(first)
+            rank = np.empty_like(order)
+            rank[order] = np.arange(len(order))
+            groups = rank[inverse.ravel()]
+
+            order_values = self.reorder_value_arr[restock_idx]
+
+            # One bit per distinct location, OR-ed together per group
+            location_index: Dict[str, int] = {}
+            location_codes = np.fromiter(
+                (location_index.setdefault(self.items[i].location, len(location_index))
+                 for i in restock_idx),
+                dtype=np.intp,
+                count=len(restock_idx),
+            )
+            if len(location_index) <= 64:
+                location_bits = np.left_shift(
+                    np.uint64(1), location_codes.astype(np.uint64))
+                location_masks = np.zeros(len(order), dtype=np.uint64)
+                np.bitwise_or.at(location_masks, groups, location_bits)
+                location_counts = [int(mask).bit_count() for mask in location_masks]
+            else:
+                locations: List[set] = [set() for _ in order]
+                for group, code in zip(groups, location_codes):
+                    locations[group].add(code)
+                location_counts = [len(group) for group in locations]
+
+            return RestockGroups(
+                supplier_ids=[supplier_ids[code] for code in unique[order]],
+                groups=groups,
+                order_values=order_values,
+                counts=np.bincount(groups, minlength=len(order)),
+                order_totals=np.bincount(
+                    groups, weights=order_values, minlength=len(order)),
+                location_counts=np.array(location_counts, dtype=np.intp),
+            )
+
+        return self._cached("restock_groups", build)
+
+    def precompute(self) -> "InventoryContext":
+        """
+        Build the cached arrays and groupings the agent tools read.
+
+        Calling this once before dispatching agents means their tool calls
+        only read shared, already-built arrays instead of racing to build
+        them on first use.
+
+        Returns:
+            This context, for chaining
+        """
+        self.below_threshold_mask
+        self.critical_mask
+        self.restock_groups
+        self.most_urgent_restock()
+        return self
+
     @property
     def total_items(self) -> int:
         """Get total number of items."""
@@ -266,13 +567,25 @@ class InventoryContext(BaseModel):
 
     @property
     def items_below_threshold(self) -> List[InventoryItem]:
-        """Get all items below reorder threshold."""
-        return [item for item in self.items if item.is_below_threshold]
+        """
+        Get all items below reorder threshold.
+
+        Picked with the cached threshold mask into a fresh list on each
+        call; call ``mark_items_changed()`` after editing items in place.
+        """
+        items = self.items
+        return [items[i] for i in np.flatnonzero(self.below_threshold_mask)]
 
     @property
     def critical_items(self) -> List[InventoryItem]:
-        """Get all critically low stock items."""
-        return [item for item in self.items if item.is_critical]
+        """
+        Get all critically low stock items.
+
+        Picked with the cached critical mask into a fresh list on each
+        call; call ``mark_items_changed()`` after editing items in place.
+        """
+        items = self.items
+        return [items[i] for i in np.flatnonzero(self.critical_mask)]
 
     @property
     def items_by_category(self) -> Dict[ProductCategory, List[InventoryItem]]:
@@ -287,12 +600,15 @@ class InventoryContext(BaseModel):
     @property
     def items_by_supplier(self) -> Dict[str, List[InventoryItem]]:
         """Group items by supplier."""
-        suppliers: Dict[str, List[InventoryItem]] = {}
-        for item in self.items:
-            if item.supplier_id not in suppliers:
-                suppliers[item.supplier_id] = []
-            suppliers[item.supplier_id].append(item)
-        return suppliers
+        # Group with the cached supplier codes instead of reading every item
+        codes, supplier_ids = self.supplier_codes
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(supplier_ids)))[:-1]
+        items = self.items
+        return {
+            supplier_id: [items[i] for i in group]
+            for supplier_id, group in zip(supplier_ids, np.split(order, bounds))
+        }
 
     def get_summary_stats(self) -> Dict[str, Union[int, float]]:
         """
@@ -305,10 +621,8 @@ class InventoryContext(BaseModel):
             "total_items": self.total_items,
             "items_below_threshold": len(self.items_below_threshold),
             "critical_items": len(self.critical_items),
-            "total_suppliers": len(set(item.supplier_id for item in self.items)),
-            "total_stock_value": sum(
-                item.current_stock * item.unit_cost for item in self.items
-            ),
+            "total_suppliers": len(self.supplier_codes[1]),
+            "total_stock_value": float(np.dot(self.stock_arr, self.unit_cost_arr)),
             "average_stock_level": (
                 sum(item.current_stock for item in self.items) / self.total_items
                 if self.total_items > 0
@@ -4,8 +4,11 @@ This module provides centralized agent execution with automatic logging of
 inputs, outputs, and performance metrics for all logistics agents.
 """
 
-from functools import wraps
-from typing import Any, Callable, Generic, Optional, Type, TypeVar
+import hashlib
+import time
+from collections import OrderedDict
+from functools import cached_property, wraps
+from typing import Any, Callable, Generic, Optional, Tuple, Type, TypeVar
 
 from agents import Agent, Runner
 
@@ -14,6 +17,71 @@ from .logging_config import get_loggers, log_system_event
 
 T = TypeVar("T")
 
+# Completed runs keyed by a hash of (agent, input, context), with the time
+# they were stored; oldest entries are evicted first
+_RESULT_CACHE: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_RESULT_CACHE_MAX_ENTRIES = 128
+
+
+def _result_cache_key(agent: Any, input_message: str, context: Any) -> Optional[str]:
+    """
+    Build a stable cache key for one agent run.
+
+    Args:
+        agent: The agent being run
+        input_message: Input message for the agent
+        context: Context data for the agent
+
+    Returns:
+        SHA-256 hex digest, or None if the context cannot be serialized
+    """
+    if not hasattr(context, "model_dump_json"):
+        return None
+
+    digest = hashlib.sha256()
+    for part in (
+        getattr(agent, "name", ""),
+        str(getattr(agent, "model", "")),
+        str(getattr(agent, "instructions", "")),
+        input_message,
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(context.model_dump_json().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def clear_result_cache() -> None:
+    """Drop all cached agent run results."""
+    _RESULT_CACHE.clear()
+
+
+def _log_agent_init(instance: Any, agent: Any, agent_class: Type[Any]) -> None:
+    """Log the creation of an agent's underlying SDK Agent."""
+    console_logger, file_logger = get_loggers()
+    agent_name = getattr(agent, "name", agent_class.__name__)
+    instructions = getattr(agent, "instructions", "No instructions available")
+    model = getattr(agent, "model", "Unknown model")
+
+    console_logger.info(f"🤖 {agent_name} initialized")
+    file_logger.info(f"AGENT_INIT | {agent_name} | Model: {model}")
+
+    # Use truncation settings for agent instructions
+    truncated_instructions = settings.truncate_text(
+        instructions, settings.log_truncate_agent_instructions
+    )
+    file_logger.info(
+        f"AGENT_INSTRUCTIONS | {agent_name} | {truncated_instructions}"
+    )
+
+    # Store original agent for logging wrapper
+    instance._original_agent = agent
+
+    # Wrap the agent's execution if it has tools
+    if hasattr(agent, "tools") and agent.tools:
+        tool_names = [getattr(tool, "name", str(tool)) for tool in agent.tools]
+        file_logger.info(f"AGENT_TOOLS | {agent_name} | Tools: {tool_names}")
+
 
 def log_agent_execution(agent_class: Type[Any]) -> Type[Any]:
     """
@@ -21,6 +89,8 @@ def log_agent_execution(agent_class: Type[Any]) -> Type[Any]:
 
     This decorator wraps the agent's __init__ method to set up logging
     and can be used to monitor agent creation and execution patterns.
+    Classes that build ``agent`` lazily through a ``cached_property`` are
+    logged when the agent is first built instead.
 
     Args:
         agent_class: The agent class to wrap with logging
@@ -28,6 +98,21 @@ def log_agent_execution(agent_class: Type[Any]) -> Type[Any]:
     Returns:
         Wrapped agent class with logging capabilities
     """
+    lazy_agent = agent_class.__dict__.get("agent")
+    if isinstance(lazy_agent, cached_property):
+        build_agent = lazy_agent.func
+
+        @wraps(build_agent)
+        def logged_build(self: Any) -> Any:
+            agent = build_agent(self)
+            _log_agent_init(self, agent, agent_class)
+            return agent
+
+        logged_agent = cached_property(logged_build)
+        logged_agent.__set_name__(agent_class, "agent")
+        agent_class.agent = logged_agent
+        return agent_class
+
     original_init = agent_class.__init__
 
     @wraps(original_init)
@@ -36,29 +121,7 @@ def log_agent_execution(agent_class: Type[Any]) -> Type[Any]:
         original_init(self, *args, **kwargs)
 
         # Log agent initialization
-        console_logger, file_logger = get_loggers()
-        agent_name = getattr(self.agent, "name", agent_class.__name__)
-        instructions = getattr(self.agent, "instructions", "No instructions available")
-        model = getattr(self.agent, "model", "Unknown model")
-
-        console_logger.info(f"🤖 {agent_name} initialized")
-        file_logger.info(f"AGENT_INIT | {agent_name} | Model: {model}")
-
-        # Use truncation settings for agent instructions
-        truncated_instructions = settings.truncate_text(
-            instructions, settings.log_truncate_agent_instructions
-        )
-        file_logger.info(
-            f"AGENT_INSTRUCTIONS | {agent_name} | {truncated_instructions}"
-        )
-
-        # Store original agent for logging wrapper
-        self._original_agent = self.agent
-
-        # Wrap the agent's execution if it has tools
-        if hasattr(self.agent, "tools") and self.agent.tools:
-            tool_names = [getattr(tool, "name", str(tool)) for tool in self.agent.tools]
-            file_logger.info(f"AGENT_TOOLS | {agent_name} | Tools: {tool_names}")
+        _log_agent_init(self, self.agent, agent_class)
 
     agent_class.__init__ = logged_init
     return agent_class
@@ -73,15 +136,21 @@ class LoggedAgentRunner:
         input_message: str,
         context: T,
         agent_name: Optional[str] = None,
+        use_cache: bool = False,
     ) -> Any:
         """
         Run an agent with comprehensive input/output logging.
 
+        With ``use_cache`` set, a run with the same agent, input and context
+        as one completed within ``settings.result_cache_ttl_seconds`` returns
+        the earlier result instead of calling the model again.
+
         Args:
             agent: The agent to run
             input_message: Input message for the agent
             context: Context data for the agent
             agent_name: Optional agent name for logging (defaults to agent.name)
+            use_cache: Reuse a recent result for an identical run
 
         Returns:
             Agent execution result
@@ -102,23 +171,44 @@ class LoggedAgentRunner:
 
         # Log context information
         context_info = "No context"
-        if hasattr(context, "items"):
+        if hasattr(context, "below_threshold_mask"):
+            # Count from the context's cached mask instead of walking the items
+            context_info = f"{len(context.items)} items"
+            below_threshold = int(context.below_threshold_mask.sum())
+            context_info += f", {below_threshold} below threshold"
+        elif hasattr(context, "items"):
             context_info = f"{len(context.items)} items"
-            below_threshold = len(
-                [
-                    item
-                    for item in context.items
-                    if hasattr(item, "is_below_threshold") and item.is_below_threshold
-                ]
+            below_threshold = sum(
+                1
+                for item in context.items
+                if getattr(item, "is_below_threshold", False)
             )
             context_info += f", {below_threshold} below threshold"
 
         file_logger.info(f"AGENT_CONTEXT | {name} | {context_info}")
 
+        cache_key = None
+        if use_cache and settings.result_cache_ttl_seconds > 0:
+            cache_key = _result_cache_key(agent, input_message, context)
+            cached = _RESULT_CACHE.get(cache_key) if cache_key else None
+            if cached is not None:
+                stored_at, result = cached
+                if time.monotonic() - stored_at < settings.result_cache_ttl_seconds:
+                    console_logger.info(f"♻️ {name} served from result cache")
+                    file_logger.info(f"AGENT_CACHE_HIT | {name} | {cache_key[:12]}")
+                    return result
+                del _RESULT_CACHE[cache_key]
+
         try:
             # Execute the agent
             result = await Runner.run(agent, input=input_message, context=context)
 
+            if cache_key:
+                _RESULT_CACHE[cache_key] = (time.monotonic(), result)
+                _RESULT_CACHE.move_to_end(cache_key)
+                while len(_RESULT_CACHE) > _RESULT_CACHE_MAX_ENTRIES:
+                    _RESULT_CACHE.popitem(last=False)
+
             # Log successful completion
             output_str = (
                 str(result.final_output)
@@ -170,7 +260,11 @@ class LoggedAgentRunner:
 
 # Convenience function for backward compatibility
 async def run_agent_with_logging(
-    agent: Agent[T], input_message: str, context: T, agent_name: Optional[str] = None
+    agent: Agent[T],
+    input_message: str,
+    context: T,
+    agent_name: Optional[str] = None,
+    use_cache: bool = False,
 ) -> Any:
     """
     Convenience function to run an agent with logging.
@@ -180,8 +274,11 @@ async def run_agent_with_logging(
         input_message: Input message for the agent
         context: Context data for the agent
         agent_name: Optional agent name for logging
+        use_cache: Reuse a recent result for an identical run
 
     Returns:
         Agent execution result
     """
-    return await LoggedAgentRunner.run_agent(agent, input_message, context, agent_name)
+    return await LoggedAgentRunner.run_agent(
+        agent, input_message, context, agent_name, use_cache=use_cache
+    )
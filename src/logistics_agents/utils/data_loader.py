@@ -61,8 +61,9 @@ def load_inventory_from_csv(csv_path: str) -> List[InventoryItem]:
         # Validate CSV structure
         validate_csv_structure(df)
 
+        # Plain dict records avoid building a pandas Series per row
         items = []
-        for index, row in df.iterrows():
+        for index, row in enumerate(df.to_dict("records")):
             try:
                 # Create InventoryItem from CSV row
                 item = _create_inventory_item_from_row(row)
@@ -144,12 +145,12 @@ def validate_csv_structure(df: pd.DataFrame) -> None:
     logger.info("CSV structure validation passed")
 
 
-def _create_inventory_item_from_row(row: pd.Series) -> InventoryItem:
+def _create_inventory_item_from_row(row: Dict) -> InventoryItem:
     """
     Create an InventoryItem from a CSV row.
 
     Args:
-        row: Pandas Series representing a CSV row
+        row: Mapping of CSV column name to value for one row
 
     Returns:
         InventoryItem object
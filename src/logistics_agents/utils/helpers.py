@@ -4,11 +4,18 @@ import re
 import time
 import uuid
 from datetime import datetime
+from string import Template
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
 
+# Currency symbols mapping
+_CURRENCY_SYMBOLS = {"USD": "$", "GBP": "£", "EUR": "€", "INR": "₹"}
+
+# Thousands separator and 2 decimal places, with the spec parsed once
+_format_amount = "{:,.2f}".format
+
 
 def format_currency(amount: float, currency: str = "USD") -> str:
     """
@@ -28,16 +35,40 @@ def format_currency(amount: float, currency: str = "USD") -> str:
         '£1,000.00'
     """
 
-    # Currency symbols mapping
-    currency_symbols = {"USD": "$", "GBP": "£", "EUR": "€", "INR": "₹"}
-
-    symbol = currency_symbols.get(currency.upper(), currency)
+    symbol = _CURRENCY_SYMBOLS.get(currency.upper(), currency)
 
     # Format with thousands separator and 2 decimal places
     if amount >= 0:
-        return f"{symbol}{amount:,.2f}"
+        return symbol + _format_amount(amount)
     else:
-        return f"-{symbol}{abs(amount):,.2f}"
+        return "-" + symbol + _format_amount(-amount)
+
+
+def specialize_template(layout: str, **static: Any) -> str:
+    """
+    Fill the fixed parts of a report layout ahead of time.
+
+    ``$name`` fields in the layout are replaced with the matching static
+    values, and braces inside those values are escaped, so the result is a
+    ``str.format_map`` template with only the per-call ``{fields}`` left.
+
+    Args:
+        layout: Report layout with ``$name`` static and ``{name}`` dynamic fields
+        **static: Values for the ``$name`` fields
+
+    Returns:
+        Template string for ``str.format_map``
+
+    Examples:
+        >>> specialize_template("$title: {count}", title="Items {all}")
+        'Items {{all}}: {count}'
+    """
+
+    escaped = {
+        name: str(value).replace("{", "{{").replace("}", "}}")
+        for name, value in static.items()
+    }
+    return Template(layout).substitute(escaped)
 
 
 def calculate_percentage_change(old_value: float, new_value: float) -> float:
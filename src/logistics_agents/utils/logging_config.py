@@ -1,9 +1,14 @@
 """Logging configuration with enhanced file logging and agent/tool tracking."""
 
+import atexit
 import getpass
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
 from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Awaitable, Callable, Optional, ParamSpec, TypeVar, cast
 
@@ -19,18 +24,49 @@ T = TypeVar("T")
 _console_logger: Optional[logging.Logger] = None
 _file_logger: Optional[logging.Logger] = None
 
+# Background writer for the log file, so logging calls only enqueue records
+_file_listener: Optional[QueueListener] = None
+
+# Serializes first-time setup when tools log from worker threads
+_setup_lock = threading.Lock()
+
+
+def _stop_file_listener() -> None:
+    """Flush queued file log records and stop the background writer."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging() -> tuple[logging.Logger, logging.Logger]:
     """Set up application logging with both console and file handlers.
 
+    Safe to call from several threads at once; only the first call
+    configures the handlers.
+
     Returns:
         Tuple of (console_logger, file_logger) for different logging needs
     """
     global _console_logger, _file_logger
 
-    if _console_logger and _file_logger:
+    with _setup_lock:
+        if _console_logger and _file_logger:
+            return _console_logger, _file_logger
+
+        # Loggers are only published once fully configured, so the
+        # lock-free check in get_loggers never sees a half-built pair
+        _console_logger, _file_logger = _configure_logging()
         return _console_logger, _file_logger
 
+
+def _configure_logging() -> tuple[logging.Logger, logging.Logger]:
+    """Create the console and file loggers and start the file writer."""
     # Create logs directory if it doesn't exist
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
@@ -42,27 +78,28 @@ def setup_logging() -> tuple[logging.Logger, logging.Logger]:
     log_filepath = logs_dir / log_filename
 
     # Console logger with Rich formatting
-    _console_logger = logging.getLogger("logistics_console")
-    _console_logger.setLevel(getattr(logging, settings.log_level.upper()))
+    console_logger = logging.getLogger("logistics_console")
+    console_logger.setLevel(getattr(logging, settings.log_level.upper()))
 
     # Clear existing handlers
-    _console_logger.handlers.clear()
+    console_logger.handlers.clear()
 
     # Rich handler for console
     console_handler = RichHandler(rich_tracebacks=True)
     console_handler.setLevel(getattr(logging, settings.log_level.upper()))
     console_format = logging.Formatter("%(message)s")
     console_handler.setFormatter(console_format)
-    _console_logger.addHandler(console_handler)
+    console_logger.addHandler(console_handler)
 
     # File logger with detailed formatting
-    _file_logger = logging.getLogger("logistics_file")
-    _file_logger.setLevel(logging.DEBUG)  # Always capture DEBUG to file
+    file_logger = logging.getLogger("logistics_file")
+    file_logger.setLevel(logging.DEBUG)  # Always capture DEBUG to file
 
     # Clear existing handlers
-    _file_logger.handlers.clear()
+    file_logger.handlers.clear()
 
-    # File handler
+    # File handler, driven from a background thread; the logger itself only
+    # puts records on a queue so callers never block on disk writes
     file_handler = logging.FileHandler(log_filepath, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
     file_format = logging.Formatter(
@@ -70,7 +107,13 @@ def setup_logging() -> tuple[logging.Logger, logging.Logger]:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     file_handler.setFormatter(file_format)
-    _file_logger.addHandler(file_handler)
+
+    global _file_listener
+    _stop_file_listener()
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_listener.start()
+    file_logger.addHandler(QueueHandler(log_queue))
 
     # Set specific logger levels for external libraries
     logging.getLogger("openai").setLevel(logging.WARNING)
@@ -78,15 +121,15 @@ def setup_logging() -> tuple[logging.Logger, logging.Logger]:
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
     # Log startup info
-    _file_logger.info(f"=== LOGISTICS AGENTS SESSION START ===")
-    _file_logger.info(f"User: {username}")
-    _file_logger.info(f"Log file: {log_filepath}")
-    _file_logger.info(
+    file_logger.info(f"=== LOGISTICS AGENTS SESSION START ===")
+    file_logger.info(f"User: {username}")
+    file_logger.info(f"Log file: {log_filepath}")
+    file_logger.info(
         f"Settings: model={settings.openai_model}, log_level={settings.log_level}"
     )
-    _console_logger.info(f"📝 Logging to: {log_filepath}")
+    console_logger.info(f"📝 Logging to: {log_filepath}")
 
-    return _console_logger, _file_logger
+    return console_logger, file_logger
 
 
 def get_loggers() -> tuple[logging.Logger, logging.Logger]:
@@ -114,9 +157,6 @@ def log_agent_interaction(
             console_logger, file_logger = get_loggers()
 
             # Log input
-            input_msg = (
-                f"🤖 {agent_name} INPUT: {args[1] if len(args) > 1 else 'No input'}"
-            )
             console_logger.info(f"🤖 {agent_name} starting...")
 
             # Use truncation settings for agent input
@@ -159,9 +199,6 @@ def log_agent_interaction(
             console_logger, file_logger = get_loggers()
 
             # Log input
-            input_msg = (
-                f"🤖 {agent_name} INPUT: {args[1] if len(args) > 1 else 'No input'}"
-            )
             console_logger.info(f"🤖 {agent_name} starting...")
 
             # Use truncation settings for agent input
@@ -213,6 +250,11 @@ def log_agent_interaction(
 def log_tool_interaction(tool_name: str) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator to log tool inputs and outputs.
 
+    Each call logs the tool's elapsed time and output length; the output
+    itself is only formatted when the file logger is at DEBUG. Log lines
+    are only built for loggers that are enabled, and when neither logger
+    is, the tool is called with no logging work at all.
+
     Args:
         tool_name: Name of the tool for logging identification
 
@@ -224,38 +266,56 @@ def log_tool_interaction(tool_name: str) -> Callable[[Callable[P, T]], Callable[
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
             console_logger, file_logger = get_loggers()
+            console_enabled = console_logger.isEnabledFor(logging.INFO)
+            file_enabled = file_logger.isEnabledFor(logging.INFO)
 
-            # Extract context info if available
-            context_info = "No context"
-            if args and hasattr(args[0], "context"):
-                ctx = args[0].context
-                if hasattr(ctx, "items"):
-                    context_info = f"{len(ctx.items)} items"
+            # Nothing would be emitted, so skip formatting and call straight through
+            if not (console_enabled or file_enabled):
+                return func(*args, **kwargs)
 
             # Log input
-            console_logger.info(f"🔧 {tool_name} executing...")
-
-            # Use truncation settings for tool input
-            truncated_context = settings.truncate_text(
-                context_info, settings.log_truncate_tool_input
-            )
-            file_logger.info(f"TOOL_INPUT | {tool_name} | Context: {truncated_context}")
+            if console_enabled:
+                console_logger.info(f"🔧 {tool_name} executing...")
+
+            if file_enabled:
+                # Extract context info if available
+                context_info = "No context"
+                if args and hasattr(args[0], "context"):
+                    ctx = args[0].context
+                    if hasattr(ctx, "items"):
+                        context_info = f"{len(ctx.items)} items"
+
+                # Use truncation settings for tool input
+                truncated_context = settings.truncate_text(
+                    context_info, settings.log_truncate_tool_input
+                )
+                file_logger.info(f"TOOL_INPUT | {tool_name} | Context: {truncated_context}")
 
             try:
                 # Execute function
+                start_ns = time.perf_counter_ns()
                 result = func(*args, **kwargs)
+                elapsed_ns = time.perf_counter_ns() - start_ns
 
                 # Log output
-                output_str = str(result)
-                console_logger.info(f"🔧 {tool_name} completed")
-
-                # Use truncation settings for tool output
-                truncated_output = settings.truncate_text(
-                    output_str, settings.log_truncate_tool_output
-                )
-                file_logger.info(
-                    f"TOOL_OUTPUT | {tool_name} | SUCCESS | {truncated_output}"
-                )
+                if console_enabled:
+                    console_logger.info(f"🔧 {tool_name} completed")
+
+                if file_enabled:
+                    output_str = str(result)
+                    file_logger.info(
+                        f"TOOL_DONE | {tool_name} | {elapsed_ns} ns | {len(output_str)} chars"
+                    )
+
+                    # Full payload only when debug output is wanted
+                    if file_logger.isEnabledFor(logging.DEBUG):
+                        # Use truncation settings for tool output
+                        truncated_output = settings.truncate_text(
+                            output_str, settings.log_truncate_tool_output
+                        )
+                        file_logger.debug(
+                            f"TOOL_OUTPUT | {tool_name} | SUCCESS | {truncated_output}"
+                        )
 
                 return result
 